@@ -18,6 +18,16 @@ DEFAULT_WINDOW_Y = 100
 # Detection settings
 DEFAULT_CONFIDENCE = 0.5
 DEFAULT_OVERLAP = 0.3
+ANALYSIS_MAX_WORKERS = 8  # Concurrent Roboflow prediction requests
+
+# PDF viewer settings
+PAGE_CACHE_SIZE = 32  # Rendered page pixmaps kept in memory
+PAGE_PREFETCH_COUNT = 32  # Pages pre-rendered in the background after opening a PDF
+
+# Project files
+# Version 2: polyline pages are trustworthy. Version 1 files (no "version" key)
+# recorded every drawn section polyline as page 1.
+PROJECT_FORMAT_VERSION = 2
 
 # File paths
 ASSETS_DIR = Path(__file__).parent.parent / "assets"
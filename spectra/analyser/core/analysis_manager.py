@@ -5,7 +5,7 @@ from PySide6.QtCore import QTimer, Qt
 
 from detection.categories_map import get_category
 from detection.roboflow import RoboflowAnalysisThread
-from sections.sections import assign_objects_to_sections, invalidate_section_assignment_cache
+from sections.sections import assign_objects_to_sections, mark_detections_changed
 
 
 class AnalysisManager:
@@ -88,7 +88,7 @@ class AnalysisManager:
             d.name = get_category(d.name)
             
         self.main_window.detections = manual_detections + detections
-        invalidate_section_assignment_cache(self.main_window)
+        mark_detections_changed(self.main_window)
         assign_objects_to_sections(self.main_window)
         self.main_window.undo_stack.clear()
         self.main_window.redo_stack.clear()
@@ -6,8 +6,6 @@ import os
 
 from config.settings import SPLASH_SCREEN_PATH
 
-from .main_window import Spectra
-
 def main():
     app = QApplication(sys.argv)
     # Set application icon
@@ -19,6 +17,8 @@ def main():
     splash.show()
     app.processEvents()  # Ensure splash screen is shown
 
+    # Import the window (and the PDF/image stack behind it) while the splash is up
+    from .main_window import Spectra
     window = Spectra()
     window.show()
     splash.finish(window)
@@ -6,7 +6,7 @@ from PySide6.QtGui import QAction, QCursor
 from PySide6.QtWidgets import QMenu
 
 from detection.types import Detection
-from sections.sections import Section, update_sections_table, polyline_intersects_bbox, assign_objects_to_sections, point_in_polygon, get_section_for_bbox, invalidate_section_assignment_cache
+from sections.sections import Section, update_sections_table, polyline_intersects_bbox, assign_objects_to_sections, get_section_for_bbox, invalidate_section_assignment_cache, mark_detections_changed, get_section_names, register_section_name
 
 class DetectionManager:
     """Manages detection operations and state"""
@@ -36,19 +36,37 @@ class DetectionManager:
             
         return filtered
 
+    def _viewer_detection(self, idx: Optional[int]) -> Optional[Detection]:
+        """Resolve an index from the viewer, which only holds the current page's filtered detections"""
+        viewer_detections = self.main_window.pdf_viewer.detections
+        if idx is not None and 0 <= idx < len(viewer_detections):
+            return viewer_detections[idx]
+        return None
+
+    def _remove_detection(self, detection: Detection):
+        """Remove this exact detection object from the full list"""
+        detections = self.main_window.detections
+        for i, candidate in enumerate(detections):
+            if candidate is detection:
+                del detections[i]
+                return
+
     def cut_detection(self, idx: int):
         """Cut a detection to clipboard"""
-        if idx is not None and 0 <= idx < len(self.main_window.detections):
-            self.clipboard_detection = self.main_window.detections[idx]
+        detection = self._viewer_detection(idx)
+        if detection is not None:
+            self.clipboard_detection = detection
             self.clipboard_cut = True
-            self.main_window.detections.pop(idx)
+            self._remove_detection(detection)
+            mark_detections_changed(self.main_window)
             self.main_window.update_objects_table()
             self.main_window.pdf_viewer.set_detections(self.get_filtered_detections())
 
     def copy_detection(self, idx: int):
         """Copy a detection to clipboard"""
-        if idx is not None and 0 <= idx < len(self.main_window.detections):
-            self.clipboard_detection = copy.deepcopy(self.main_window.detections[idx])
+        detection = self._viewer_detection(idx)
+        if detection is not None:
+            self.clipboard_detection = copy.deepcopy(detection)
             self.clipboard_cut = False
 
     def paste_detection(self, idx: Optional[int] = None, pos: Optional[QPoint] = None):
@@ -74,7 +92,7 @@ class DetectionManager:
                 
             self.main_window.detections.append(new_det)
             # Invalidate cache since detections changed
-            invalidate_section_assignment_cache(self.main_window)
+            mark_detections_changed(self.main_window)
             # Assign section by polyline if possible
             self._assign_detection_to_section(new_det)
             # Robust: reassign all objects after any change
@@ -90,8 +108,8 @@ class DetectionManager:
 
     def delete_detection(self, idx: int):
         """Delete a detection"""
-        if idx is not None and 0 <= idx < len(self.main_window.detections):
-            detection = self.main_window.detections[idx]
+        detection = self._viewer_detection(idx)
+        if detection is not None:
             
             from PySide6.QtWidgets import QMessageBox
             reply = QMessageBox.question(
@@ -103,16 +121,16 @@ class DetectionManager:
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.main_window.detections.pop(idx)
-                invalidate_section_assignment_cache(self.main_window)
+                self._remove_detection(detection)
+                mark_detections_changed(self.main_window)
                 self.main_window.update_objects_table()
                 self.main_window.pdf_viewer.set_detections(self.get_filtered_detections())
                 self.main_window.update_results_table()
 
     def edit_detection(self, idx: int):
         """Edit a detection's properties"""
-        if idx is not None and 0 <= idx < len(self.main_window.detections):
-            detection = self.main_window.detections[idx]
+        detection = self._viewer_detection(idx)
+        if detection is not None:
             from ui.dialogs.detection_dialog import DetectionDialog
             
             dialog = DetectionDialog(self.main_window, detection)
@@ -161,7 +179,7 @@ class DetectionManager:
             self.main_window.undo_stack.append(self.main_window.detections.copy())
             self.main_window.redo_stack.clear()
             self.main_window.detections.append(new_detection)
-            invalidate_section_assignment_cache(self.main_window)
+            mark_detections_changed(self.main_window)
             assign_objects_to_sections(self.main_window)
             self.main_window.update_objects_table()
             self.main_window.pdf_viewer.set_detections(self.get_filtered_detections())
@@ -169,11 +187,11 @@ class DetectionManager:
 
     def _handle_new_section(self, section_name: str, line_size: Optional[float]):
         """Handle creation of new sections when editing detections"""
-        if section_name != "Unassigned" and section_name not in [
-            section.name for section in self.main_window.sections_list
-        ]:
+        if section_name != "Unassigned" and section_name not in get_section_names(self.main_window):
             new_section = Section(section_name)
             self.main_window.sections_list.append(new_section)
+            register_section_name(self.main_window, section_name)
+            invalidate_section_assignment_cache(self.main_window)
             # Use debounced updates
             self.main_window.update_sections_table()
             self.main_window.update_section_filter_dropdown()
@@ -210,6 +228,7 @@ class DetectionManager:
             return
         self.main_window.redo_stack.append(self.main_window.detections.copy())
         self.main_window.detections = self.main_window.undo_stack.pop()
+        mark_detections_changed(self.main_window)
         self.main_window.pdf_viewer.set_detections(self.main_window.detections)
         self.main_window.update_objects_table()
 
@@ -219,16 +238,20 @@ class DetectionManager:
             return
         self.main_window.undo_stack.append(self.main_window.detections.copy())
         self.main_window.detections = self.main_window.redo_stack.pop()
+        mark_detections_changed(self.main_window)
         self.main_window.pdf_viewer.set_detections(self.main_window.detections)
         self.main_window.update_objects_table()
 
     def on_bbox_changed(self, idx: int, bbox):
         """Handle bounding box changes from drag/resize"""
-        if 0 <= idx < len(self.main_window.detections):
-            self.main_window.detections[idx].bbox = bbox
-        from sections.sections import assign_objects_to_sections
+        detection = self._viewer_detection(idx)
+        if detection is None:
+            return
+        detection.bbox = bbox
+        mark_detections_changed(self.main_window)
         assign_objects_to_sections(self.main_window)
-        self.main_window.update_objects_table()
+        # Only this detection's bbox and section can have changed
+        self.main_window.update_detection_row(detection)
 
     def on_bbox_right_clicked(self, bbox_index: int, global_pos=None):
         """Handle right-click on bounding box"""
@@ -1,7 +1,7 @@
 import csv
 import os
 import re
-from typing import List
+from typing import Dict, List, Optional, Set
 
 from PySide6.QtCore import QPoint, Qt, QTimer, QThread
 from PySide6.QtWidgets import (
@@ -37,7 +37,6 @@ from sections.sections import (
     add_section_with_points,
     import_sections_csv,
     show_section_context_menu,
-    update_sections_table,
 )
 from ui.menus import MenuManager
 from ui.panels.objects_panel import ObjectsPanel
@@ -79,6 +78,14 @@ class Spectra(QMainWindow):
         self.confidence = DEFAULT_CONFIDENCE
         self.overlap = DEFAULT_OVERLAP
         self.sections_list: List[Section] = []
+        self._section_names: Optional[Set[str]] = None  # Lazy index of section names
+        self._name_counters: Dict[str, int] = {}  # Next numbered-name suffix per base name
+        self._section_batch_depth = 0  # > 0 while batched_section_updates holds refreshes back
+        self._filter_dropdown_names: Optional[List[str]] = None  # Names last shown in the filters
+        # Bumped on every change that can affect which section a detection falls in
+        self._sections_version = 0
+        self._detections_version = 0
+        self._assigned_versions = None  # Versions the current section assignments were made for
         self.mode_label = None  # QLabel for mode indicator
 
         # Initialize managers
@@ -120,6 +127,9 @@ class Spectra(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
+        # Keep every pane visible and only re-layout once a handle drag ends
+        main_splitter.setChildrenCollapsible(False)
+        main_splitter.setOpaqueResize(False)
         layout = central_widget.layout()
         if layout is None:
             layout = QVBoxLayout()
@@ -329,6 +339,10 @@ class Spectra(QMainWindow):
         """Update the objects table with debouncing"""
         request_update(UPDATE_OBJECTS_TABLE)
     
+    def update_detection_row(self, detection):
+        """Repaint a single detection's row in the objects table"""
+        self.objects_panel.refresh_detection(detection)
+
     def _update_objects_table_safe(self):
         """Thread-safe internal method to update objects table"""
         self.objects_panel.update_objects_table()
@@ -344,20 +358,29 @@ class Spectra(QMainWindow):
 
     def update_sections_table(self):
         """Update the sections table with debouncing"""
+        if self._section_batch_depth:
+            return
         request_update(UPDATE_SECTIONS_TABLE)
     
     def _update_sections_table_immediate(self):
         """Immediate update of sections table (called by update manager)"""
-        update_sections_table(self)
+        self.sections_panel.refresh_table()
 
     def update_section_filter_dropdown(self):
         """Update section filter dropdowns with debouncing"""
+        if self._section_batch_depth:
+            return
         request_update(UPDATE_SECTION_FILTER)
     
     def _update_section_filter_dropdown_immediate(self):
         """Immediate update of section filter dropdowns (called by update manager)"""
-        self.objects_panel.update_section_filter_dropdown()
-        self.results_panel.update_results_section_filter_dropdown()
+        section_names = [section.name for section in self.sections_list]
+        # Line size and color edits also land here; skip if the names are unchanged
+        if section_names == self._filter_dropdown_names:
+            return
+        self._filter_dropdown_names = section_names
+        self.objects_panel.update_section_filter_dropdown(section_names)
+        self.results_panel.update_results_section_filter_dropdown(section_names)
 
     def update_results_table(self):
         """Update the results table with debouncing"""
@@ -366,7 +389,7 @@ class Spectra(QMainWindow):
     def _update_results_table_immediate(self):
         """Immediate update of results table (called by update manager)"""
         self.results_panel.update_results_table()
-    
+
     def _apply_pending_updates(self):
         """Apply all pending UI updates based on what was requested"""
         update_manager = get_update_manager()
@@ -491,6 +514,10 @@ class Spectra(QMainWindow):
         )
         if not file_path:
             return
+        # Don't export rows from before a pending background calculation
+        self.results_panel.update_results_table(wait=True)
+        if not self.results_panel.is_current():
+            return
         with open(file_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             headers = [
@@ -503,19 +530,14 @@ class Spectra(QMainWindow):
                 "Total",
             ]
             writer.writerow(headers)
-            for row in range(self.results_panel.results_table.rowCount()):
-                writer.writerow(
-                    [
-                        (
-                            self.results_panel.results_table.item(row, col).text()
-                            if self.results_panel.results_table.item(row, col)
-                            else ""
-                        )
-                        for col in range(self.results_panel.results_table.columnCount())
-                    ]
-                )
+            writer.writerows(self.results_panel.results_model.formatted_rows())
 
     # Property accessors for managers
+    @property
+    def data_version(self):
+        """Changes whenever detections or sections are modified"""
+        return (self._detections_version, self._sections_version)
+
     @property
     def pdf_viewer(self):
         return self.viewer_panel.pdf_viewer
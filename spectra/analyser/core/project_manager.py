@@ -2,8 +2,9 @@ import json
 
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
+from config.settings import PROJECT_FORMAT_VERSION
 from detection.types import Detection
-from sections.sections import Section
+from sections.sections import Section, invalidate_section_assignment_cache, invalidate_section_names, mark_detections_changed
 
 
 class ProjectManager:
@@ -43,6 +44,9 @@ class ProjectManager:
         self.main_window.undo_stack.clear()
         self.main_window.redo_stack.clear()
         self.main_window.sections_list.clear()
+        invalidate_section_names(self.main_window)
+        invalidate_section_assignment_cache(self.main_window)
+        mark_detections_changed(self.main_window)
         
         # Update UI - these are already debounced in the main window
         self.main_window.update_sections_table()
@@ -68,13 +72,22 @@ class ProjectManager:
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 
-            # Clear current state
-            self.main_window.sections_list = [
-                Section.from_dict(s) for s in data.get("sections", [])
-            ]
-            self.main_window.detections = [
-                Detection.from_dict(d) for d in data.get("detections", [])
-            ]
+            # Reset viewer state first, it holds a reference to sections_list
+            self.main_window.pdf_viewer.cleanup()
+
+            # Replace contents in place so existing references stay valid
+            self.main_window.sections_list[:] = Section.from_dicts(data.get("sections", ()))
+            if data.get("version", 1) < 2:
+                # Drawn polylines were all stamped page 1, so a page-1 polyline
+                # could be from any page; let it apply to every page instead
+                for section in self.main_window.sections_list:
+                    for polyline in section.polylines:
+                        if polyline.page == 1:
+                            polyline.page = None
+            invalidate_section_names(self.main_window)
+            invalidate_section_assignment_cache(self.main_window)
+            mark_detections_changed(self.main_window)
+            self.main_window.detections[:] = Detection.from_dicts(data.get("detections", ()))
             self.main_window.confidence = data.get("confidence", 0.5)
             self.main_window.overlap = data.get("overlap", 0.3)
             self.main_window.api_key = data.get("api_key", None)
@@ -85,8 +98,6 @@ class ProjectManager:
             self.main_window.update_objects_table()
             
             # Do not auto-load PDF, just update viewer state
-            self.main_window.pdf_viewer.cleanup()
-            
             self.main_window.pdf_viewer.set_detections(self.main_window.detections)
             self.main_window.pdf_viewer.set_sections(self.main_window.sections_list)
             QMessageBox.information(
@@ -111,6 +122,7 @@ class ProjectManager:
             return None
             
         data = {
+            "version": PROJECT_FORMAT_VERSION,
             "sections": [section.to_dict() for section in self.main_window.sections_list],
             "detections": [detection.to_dict() for detection in self.main_window.detections],
             "confidence": self.main_window.confidence,
@@ -137,9 +149,11 @@ class ProjectManager:
 
         if file_path:
             if self.main_window.pdf_viewer.load_pdf(file_path):
+                self.main_window.pdf_viewer.prefetch_pages()
                 self.main_window.current_pdf_path = file_path
                 self.main_window.update_navigation_controls()
                 self.main_window.detections.clear()
+                mark_detections_changed(self.main_window)
                 self.main_window.update_objects_table()
 
     def save_pdf(self):
@@ -1,4 +1,12 @@
 # categories_map.py
+import sys
+from functools import lru_cache
+
+
+def _normalize_key(key: str) -> str:
+    """Lookup form of a key: stripped, lower-cased and interned"""
+    return sys.intern(key.strip().lower())
+
 
 # List of all frequency categories from frequency.csv
 FREQUENCY_CATEGORIES = [
@@ -60,6 +68,20 @@ OBJECT_TO_FREQUENCY_CATEGORY = {
     # Add more as needed
 }
 
+# Intern the hot lookup strings so key compares are pointer checks and
+# detections share one copy of each category name
+OBJECT_TO_FREQUENCY_CATEGORY = {
+    sys.intern(k): sys.intern(v) for k, v in OBJECT_TO_FREQUENCY_CATEGORY.items()
+}
+
+# Lower-cased frequency category names, so direct matches are a dict lookup
+_FREQ_CAT_LOWER = {
+    _normalize_key(cat): sys.intern(cat) for cat in FREQUENCY_CATEGORIES
+}
+
+# Object types take precedence over direct category-name matches
+_FREQUENCY_LOOKUP = {**_FREQ_CAT_LOWER, **OBJECT_TO_FREQUENCY_CATEGORY}
+
 def get_frequency_category(object_type):
     """
     Map a program object type (string) to a frequency category from the frequency table.
@@ -67,68 +89,59 @@ def get_frequency_category(object_type):
     """
     if not object_type:
         return None
-    key = str(object_type).strip().lower()
-    result = OBJECT_TO_FREQUENCY_CATEGORY.get(key)
-    if result is not None:
-        return result
-    # Try direct match to frequency categories (case-insensitive)
-    for cat in FREQUENCY_CATEGORIES:
-        if key == cat.strip().lower():
-            return cat
-    return None
+    return _frequency_category(str(object_type))
 
+@lru_cache(maxsize=2048)
+def _frequency_category(object_type):
+    return _FREQUENCY_LOOKUP.get(_normalize_key(object_type))
+
+@lru_cache(maxsize=1)
 def get_all_frequency_categories():
     """
-    Return a list of all frequency categories from the frequency table.
+    Return all frequency categories from the frequency table, as a shared read-only tuple.
     """
-    return FREQUENCY_CATEGORIES.copy()
-
-# Hardcoded mapping from categories.csv
-_CATEGORIES_RAW = [
-    ("1", "Manual Valve"),
-    ("2", "Manual Valve"),
-    ("3", "Manual Valve"),
-    ("4", "Manual Valve"),
-    ("5", "Manual Valve"),
-    ("6", "Manual Valve"),
-    ("7", "Manual Valve"),
-    ("8", "Manual Valve"),
-    ("9", "Manual Valve"),
-    ("10", "Manual Valve"),
-    ("11", "Manual Valve"),
-    ("12", "Manual Valve"),
-    ("13", "Manual Valve"),
-    ("14", "Manual Valve"),
-    ("15", "Manual Valve"),
-    ("16", "Relief Valve"),
-    ("17", "Spectacle Blind"),
-    ("18", "Spectacle Blind"),
-    ("19", "Spectacle Blind"),
-    ("20", "Expander"),
-    ("21", "Flange"),
-    ("22", "Strainer"),
-    ("23", "Piping"),
-    ("24", "Check Valve"),
-    ("25", "Actuated Valve"),
-    ("26", "Instrument"),
-    ("27", "Instrument"),
-    ("28", "Instrument"),
-    ("29", "Instrument"),
-    ("30", "Instrument"),
-    ("31", "Instrument"),
-    ("32", "Instrument"),
-    ("Pneumatic valve", "Actuated Valve"),
-    ("Two way on-off solenoid valve", "Actuated Valve"),
-]
+    return tuple(FREQUENCY_CATEGORIES)
 
-# Build a case-insensitive mapping
-def _build_mapping():
-    mapping = {}
-    for k, v in _CATEGORIES_RAW:
-        mapping[str(k).strip().lower()] = v
-    return mapping
+# Hardcoded mapping from categories.csv, keyed by normalized (lower-case) label
+_CATEGORIES_MAP = {
+    "1": "Manual Valve",
+    "2": "Manual Valve",
+    "3": "Manual Valve",
+    "4": "Manual Valve",
+    "5": "Manual Valve",
+    "6": "Manual Valve",
+    "7": "Manual Valve",
+    "8": "Manual Valve",
+    "9": "Manual Valve",
+    "10": "Manual Valve",
+    "11": "Manual Valve",
+    "12": "Manual Valve",
+    "13": "Manual Valve",
+    "14": "Manual Valve",
+    "15": "Manual Valve",
+    "16": "Relief Valve",
+    "17": "Spectacle Blind",
+    "18": "Spectacle Blind",
+    "19": "Spectacle Blind",
+    "20": "Expander",
+    "21": "Flange",
+    "22": "Strainer",
+    "23": "Piping",
+    "24": "Check Valve",
+    "25": "Actuated Valve",
+    "26": "Instrument",
+    "27": "Instrument",
+    "28": "Instrument",
+    "29": "Instrument",
+    "30": "Instrument",
+    "31": "Instrument",
+    "32": "Instrument",
+    "pneumatic valve": "Actuated Valve",
+    "two way on-off solenoid valve": "Actuated Valve",
+}
 
-_CATEGORIES_MAP = _build_mapping()
+# Intern keys and values like the frequency map above
+_CATEGORIES_MAP = {sys.intern(k): sys.intern(v) for k, v in _CATEGORIES_MAP.items()}
 
 
 def get_category(key):
@@ -138,7 +151,12 @@ def get_category(key):
     """
     if key is None:
         return "Unknown"
-    return _CATEGORIES_MAP.get(str(key).strip().lower(), "Unknown")
+    return _category(str(key))
+
+
+@lru_cache(maxsize=2048)
+def _category(key):
+    return _CATEGORIES_MAP.get(_normalize_key(key), "Unknown")
 
 
 def get_all_categories():
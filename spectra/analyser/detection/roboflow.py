@@ -1,10 +1,49 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from typing import List
 
-from roboflow import Roboflow
-
 from PySide6.QtCore import QThread, Signal
+from config.settings import ANALYSIS_MAX_WORKERS
 from detection.types import Detection
 
+@lru_cache(maxsize=4)
+def _get_model(api_key: str, project: str, version: int):
+    """Resolve (and memoize) a hosted Roboflow model; each step is a network call"""
+    # The SDK is heavy to import and only needed once an analysis runs
+    from roboflow import Roboflow
+    rf = Roboflow(api_key=api_key)
+    return rf.workspace().project(project).version(version).model
+
+# Fetch all fields a detection needs from a prediction in one C-level call
+_prediction_fields = itemgetter("x", "y", "width", "height", "class", "confidence")
+
+def parse_predictions(predictions: List[dict], page_num: int) -> List[Detection]:
+    """Convert Roboflow center/size predictions into corner-bbox detections"""
+    detections = []
+    append = detections.append
+    fields = _prediction_fields
+    make_detection = Detection
+    for prediction in predictions:
+        x_center, y_center, width, height, name, confidence = fields(prediction)
+        half_width = width * 0.5
+        half_height = height * 0.5
+        append(make_detection(
+            name,
+            confidence,
+            (
+                int(x_center - half_width),
+                int(y_center - half_height),
+                int(x_center + half_width),
+                int(y_center + half_height),
+            ),
+            page_num,
+            source="model"
+        ))
+    return detections
+
 class RoboflowAnalysisThread(QThread):
     """Thread for running Roboflow analysis without blocking UI
     
@@ -33,47 +72,49 @@ class RoboflowAnalysisThread(QThread):
         3. NOT access any UI components directly
         """
         try:
-            rf = Roboflow(api_key=self.api_key)
-            project = rf.workspace().project("schemas")
-            model = project.version(1).model
+            model = _get_model(self.api_key, "schemas", 1)
             
-            all_detections = []
-            
-            for i, image_path in enumerate(self.image_paths):
-                # Emit progress signal (will be handled on main thread)
-                self.progress_updated.emit(i + 1, len(self.image_paths))
-                
-                result = model.predict(
-                    image_path, 
-                    confidence=int(self.conf_threshold * 100),
-                    overlap=self.overlap_threshold
-                ).json()
-                
-                page_detections = []
-                for prediction in result["predictions"]:
-                    x_center = prediction["x"]
-                    y_center = prediction["y"]
-                    width = prediction["width"]
-                    height = prediction["height"]
-                    
-                    x1 = int(x_center - width / 2)
-                    y1 = int(y_center - height / 2)
-                    x2 = int(x_center + width / 2)
-                    y2 = int(y_center + height / 2)
-                    
-                    detection = Detection(
-                        name=prediction["class"],
-                        confidence=prediction["confidence"],
-                        bbox=(x1, y1, x2, y2),
-                        page_num=i + 1,
-                        source="model"
-                    )
-                    page_detections.append(detection)
-                
-                all_detections.extend(page_detections)
+            total = len(self.image_paths)
+            page_results: List[List[Detection]] = [[] for _ in range(total)]
+
+            # Predictions are network bound, so run the pages concurrently
+            with ThreadPoolExecutor(max_workers=ANALYSIS_MAX_WORKERS) as pool:
+                futures = {
+                    pool.submit(self._predict_page, model, image_path, i + 1): i
+                    for i, image_path in enumerate(self.image_paths)
+                }
+                last_percent = -1
+                try:
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        page_results[futures[future]] = future.result()
+                        # Emit progress signal (will be handled on main thread),
+                        # at most once per whole percent to spare the UI thread
+                        percent = done * 100 // total
+                        if percent != last_percent:
+                            last_percent = percent
+                            self.progress_updated.emit(done, total)
+                except Exception:
+                    # One failed page fails the analysis; don't send the queued ones
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+            # Keep detections in page order regardless of completion order
+            all_detections = list(chain.from_iterable(page_results))
             
             # Emit completion signal (will be handled on main thread)
             self.analysis_complete.emit(all_detections)
         except Exception as e:
             # Emit error signal (will be handled on main thread)
-            self.error_occurred.emit(str(e))
\ No newline at end of file
+            self.error_occurred.emit(str(e))
+
+    def _predict_page(self, model, image_path: str, page_num: int) -> List[Detection]:
+        """Run the model on one page image and parse its predictions (worker thread)"""
+        # predict() stores the request settings on the model instance before
+        # posting, so calls on the shared cached model could race. A shallow
+        # copy per page keeps that state separate without resolving it again.
+        result = copy.copy(model).predict(
+            image_path, 
+            confidence=int(self.conf_threshold * 100),
+            overlap=self.overlap_threshold
+        ).json()
+        return parse_predictions(result["predictions"], page_num)
\ No newline at end of file
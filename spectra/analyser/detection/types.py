@@ -1,7 +1,15 @@
+import sys
 from typing import Tuple, Optional
 from dataclasses import dataclass
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _intern(value):
+    """Intern strings; leave anything else (e.g. a null from a project file) as is"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+@dataclass(**_SLOTS)
 class Detection:
     """Data class for detection results"""
     name: str
@@ -14,6 +22,12 @@ class Detection:
     count: int = 1  # Number of identical objects in the box
     color: Optional[object] = None  # QColor or None, always set from section, not user-editable
 
+    def __post_init__(self):
+        # Names, sections and sources repeat across thousands of detections
+        self.name = _intern(self.name)
+        self.section = _intern(self.section)
+        self.source = _intern(self.source)
+
     def to_dict(self):
         return {
             'name': self.name,
@@ -38,4 +52,8 @@ class Detection:
             line_size=data.get('line_size', None),
             count=data.get('count', 1),
             color=data.get('color', None)  # Only set if present, but not user-editable
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def from_dicts(items):
+        return [Detection.from_dict(d) for d in items]
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Geometry tests for section polylines against detection boxes (no Qt dependency).
+"""
+
+from collections import defaultdict
+
+
+def polyline_intersects_bbox(points, bbox):
+    """Return True if any segment of the polyline intersects the bbox."""
+    if not points or len(points) < 2:
+        return False
+    x1, y1, x2, y2 = bbox
+    if x1 > x2:
+        x1, x2 = x2, x1
+    if y1 > y2:
+        y1, y2 = y2, y1
+    # Cohen-Sutherland outcodes: 0 means the point lies in the bbox, and two
+    # endpoints sharing an outside bit put the whole segment beyond that edge
+    ax, ay = points[0]
+    prev_code = (ax < x1) | ((ax > x2) << 1) | ((ay < y1) << 2) | ((ay > y2) << 3)
+    if prev_code == 0:
+        return True
+    for i in range(1, len(points)):
+        bx, by = points[i]
+        code = (bx < x1) | ((bx > x2) << 1) | ((by < y1) << 2) | ((by > y2) << 3)
+        if code == 0:
+            return True
+        # Outcodes are already known here, so go straight to the clip
+        if not (code & prev_code) and _clip_segment(ax, ay, bx, by, x1, y1, x2, y2):
+            return True
+        ax, ay, prev_code = bx, by, code
+    return False
+
+def segment_intersects_rect(p1, p2, x1, y1, x2, y2):
+    """Check if a line segment (p1, p2) intersects a rectangle (x1, y1, x2, y2)."""
+    ax, ay = p1
+    bx, by = p2
+    # Outcodes: an endpoint inside accepts, a shared outside bit rejects
+    code1 = (ax < x1) | ((ax > x2) << 1) | ((ay < y1) << 2) | ((ay > y2) << 3)
+    code2 = (bx < x1) | ((bx > x2) << 1) | ((by < y1) << 2) | ((by > y2) << 3)
+    if code1 == 0 or code2 == 0:
+        return True
+    if code1 & code2:
+        return False
+    return _clip_segment(ax, ay, bx, by, x1, y1, x2, y2)
+
+def _clip_segment(ax, ay, bx, by, x1, y1, x2, y2):
+    """Liang-Barsky test for a segment whose endpoints both lie outside the rectangle."""
+    # Clip the parameter range [t0, t1] of a + t * (b - a)
+    # against each edge's half-plane; the segment hits if any range survives
+    dx = bx - ax
+    dy = by - ay
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, ax - x1), (dx, x2 - ax), (-dy, ay - y1), (dy, y2 - ay)):
+        if p == 0:
+            # Parallel to this edge: outside its half-plane means no hit
+            if q < 0:
+                return False
+        elif p < 0:
+            t = q / p  # entering
+            if t > t1:
+                return False
+            if t > t0:
+                t0 = t
+        else:
+            t = q / p  # leaving
+            if t < t0:
+                return False
+            if t < t1:
+                t1 = t
+    return True
+
+def point_in_polygon(point, poly):
+    """Ray casting algorithm for point-in-polygon test."""
+    x, y = point
+    if len(poly) < 3:
+        return False
+    inside = False
+    # Walk the closed ring edge by edge, starting with the closing edge
+    px1, py1 = poly[-1]
+    for px2, py2 in poly:
+        # Edge straddles the ray's height (one end below, the other at or above),
+        # which also guarantees py1 != py2 for the division
+        if (py1 >= y) != (py2 >= y):
+            if x <= (y - py1) * (px2 - px1) / (py2 - py1) + px1:
+                inside = not inside
+        px1, py1 = px2, py2
+    return inside
+
+
+class BoxGrid:
+    """Uniform grid over axis-aligned boxes, answering which stored boxes may overlap a query box.
+
+    Keys are small integers; each box is recorded in every cell it covers, and
+    queries return the keys found in the cells the query box covers.
+    """
+
+    def __init__(self, boxes, cells_per_side=32):
+        self._cells = defaultdict(list)
+        if not boxes:
+            self._origin = (0.0, 0.0)
+            self._cell_size = 1.0
+            self._last_cell = 0
+            return
+        min_x = min(box[0] for box in boxes)
+        min_y = min(box[1] for box in boxes)
+        extent = max(max(box[2] for box in boxes) - min_x, max(box[3] for box in boxes) - min_y)
+        self._origin = (min_x, min_y)
+        self._cell_size = extent / cells_per_side or 1.0
+        self._last_cell = cells_per_side - 1
+        for key, box in enumerate(boxes):
+            cx1, cy1, cx2, cy2 = self._cell_range(box)
+            for cx in range(cx1, cx2 + 1):
+                for cy in range(cy1, cy2 + 1):
+                    self._cells[cx, cy].append(key)
+
+    def _cell_range(self, box):
+        """Cells covered by a normalized box, clamped to the grid"""
+        ox, oy = self._origin
+        size = self._cell_size
+        last = self._last_cell
+        return (
+            min(max(int((box[0] - ox) // size), 0), last),
+            min(max(int((box[1] - oy) // size), 0), last),
+            min(max(int((box[2] - ox) // size), 0), last),
+            min(max(int((box[3] - oy) // size), 0), last),
+        )
+
+    def query(self, box):
+        """Return the keys of stored boxes sharing a cell with the query box, in ascending order"""
+        x1, y1, x2, y2 = box
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        cx1, cy1, cx2, cy2 = self._cell_range((x1, y1, x2, y2))
+        cells = self._cells
+        if cx1 == cx2 and cy1 == cy2:
+            return cells.get((cx1, cy1), [])
+        keys = set()
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                keys.update(cells.get((cx, cy), ()))
+        return sorted(keys)
+
+
+class SectionIndex:
+    """Spatial index over section polylines for assigning many bboxes in one pass.
+
+    Polylines are grouped by page and bucketed by bounding box on a uniform
+    grid per page, so each query only runs the exact intersection test on
+    polylines near the bbox on the same page. Polylines without a page count
+    on every page. Matches follow the same order as
+    sections.find_section_for_bbox: most recently added section first.
+    """
+
+    def __init__(self, sections_list):
+        entries = []  # (page, section, points, polyline bbox) in search order
+        for section in reversed(sections_list):
+            for polyline in section.polylines:
+                if len(polyline.points) < 2:
+                    continue
+                entries.append((polyline.page, section, polyline.points, polyline.bbox))
+        # Page-agnostic (None) polylines are indexed on every page, and alone
+        # under None for pages without polylines of their own
+        self._pages = {}
+        for page in {entry[0] for entry in entries} | {None}:
+            page_entries = [entry[1:] for entry in entries if entry[0] is None or entry[0] == page]
+            if page_entries:
+                self._pages[page] = (page_entries, BoxGrid([entry[2] for entry in page_entries]))
+
+    def find(self, bbox, page):
+        """Return the first section with a polyline on the page crossing the bbox, or None."""
+        indexed = self._pages.get(page, self._pages.get(None))
+        if indexed is None:
+            return None
+        entries, grid = indexed
+        x1, y1, x2, y2 = bbox
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        for key in grid.query((x1, y1, x2, y2)):
+            section, points, (px1, py1, px2, py2) = entries[key]
+            if x2 < px1 or x1 > px2 or y2 < py1 or y1 > py2:
+                continue
+            if polyline_intersects_bbox(points, bbox):
+                return section
+        return None
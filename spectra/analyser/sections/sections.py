@@ -1,36 +1,100 @@
 import colorsys
-import copy
+import csv
+import itertools
 import math
+import re
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Set
-from collections import defaultdict
 import time
 
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QTimer
 from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QFileDialog, QMessageBox, QTableWidgetItem
+from PySide6.QtWidgets import QColorDialog, QFileDialog, QMenu, QMessageBox
+
+from sections.geometry import SectionIndex, polyline_intersects_bbox
 
 RAINBOW_COLORS = 12  # Number of distinct colors before looping
+SECTION_REASSIGN_DELAY_MS = 150  # Quiet period after section edits before reassigning detections
+
+# The palette is finite, so convert it from HSV once at import
+_RAINBOW_RGB = tuple(
+    (int(r*255), int(g*255), int(b*255))
+    for r, g, b in (colorsys.hsv_to_rgb(i / RAINBOW_COLORS, 0.85, 0.95) for i in range(RAINBOW_COLORS))
+)
 
 def get_next_rainbow_color(index: int) -> QColor:
     """Return a QColor from a rainbow palette, cycling by index."""
-    hue = (index % RAINBOW_COLORS) / RAINBOW_COLORS
-    rgb = colorsys.hsv_to_rgb(hue, 0.85, 0.95)
-    return QColor(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
+    # A new QColor each call, since callers may modify the section's color
+    return QColor(*_RAINBOW_RGB[index % RAINBOW_COLORS])
+
+# Global source of polyline revisions, so a revision identifies one polyline state
+_polyline_revisions = itertools.count(1)
 
 class Polyline:
     def __init__(self, points, page):
-        self.points = points  # list of (x, y) tuples
-        self.page = page      # int
+        self.points = points  # tuple of (x, y) tuples
+        self.page = page      # int, or None when unknown; such polylines apply to every page
+
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        # Frozen, so every change goes through this setter and bumps the revision
+        self._points = tuple(points)
+        self.mark_changed()
+
+    def on_page(self, page: int) -> bool:
+        """Whether the polyline belongs to the given 1-based page"""
+        return self.page is None or self.page == page
+
+    def mark_changed(self):
+        """Record a change to the points"""
+        self.revision = next(_polyline_revisions)
+        self._bbox = None  # Recomputed on the next bbox access
+
+    def move_point(self, index: int, point: Tuple[float, float]):
+        """Replace the point at index"""
+        points = self._points
+        self.points = points[:index] + (point,) + points[index + 1:]
+
+    def insert_point(self, index: int, point: Tuple[float, float]):
+        """Insert a point before index"""
+        points = self._points
+        self.points = points[:index] + (point,) + points[index:]
+
+    def remove_point(self, index: int):
+        """Remove the point at index"""
+        points = self._points
+        self.points = points[:index] + points[index + 1:]
+
+    @property
+    def bbox(self) -> Optional[Tuple[float, float, float, float]]:
+        """Bounding box (min_x, min_y, max_x, max_y) of the points, or None if there are none"""
+        if self._bbox is None and self._points:
+            xs, ys = zip(*self._points)
+            self._bbox = (min(xs), min(ys), max(xs), max(ys))
+        return self._bbox
+
+    def clone(self) -> 'Polyline':
+        """Return an independent copy; the frozen points are shared"""
+        return Polyline(self.points, self.page)
 
     def to_dict(self):
         return {'points': self.points, 'page': self.page}
 
     @staticmethod
     def from_dict(data):
-        return Polyline(data['points'], data['page'])
+        # JSON stores points as [x, y] lists; keep them as (x, y) tuples like drawn polylines
+        return Polyline(list(map(tuple, data['points'])), data.get('page'))
 
 class Section:
     """Represents a section with name, line size, multiple polylines, and color properties"""
+    __slots__ = ('name', 'line_size', 'polylines', 'color', '_bbox_cache', '_bbox_key')
+
     def __init__(self, name: str, line_size: Optional[float] = None, polylines: Optional[List['Polyline']] = None, color: Optional[QColor] = None, color_index: Optional[int] = None):
         self.name = name
         self.line_size = line_size
@@ -43,7 +107,7 @@ class Section:
         else:
             self.color = get_next_rainbow_color(0)
         self._bbox_cache = None  # Cache for bounding box
-        self._last_polyline_count = 0  # Track changes for cache invalidation
+        self._bbox_key = None  # Polyline revisions the cached bounding box was computed from
     
     def __str__(self):
         return self.name
@@ -69,171 +133,177 @@ class Section:
             color=color
         )
 
+    @staticmethod
+    def from_dicts(items):
+        return [Section.from_dict(s) for s in items]
+
+    def clone(self) -> 'Section':
+        """Return an independent copy of this section without going through copy.deepcopy"""
+        section = Section(
+            self.name,
+            line_size=self.line_size,
+            polylines=[polyline.clone() for polyline in self.polylines],
+        )
+        section.color = QColor(self.color) if self.color is not None else None
+        return section
+
     def get_bounding_box(self) -> Optional[Tuple[float, float, float, float]]:
         """Get the bounding box of all polylines in this section"""
         if not self.polylines:
             return None
             
-        # Check if cache is valid
-        if self._bbox_cache is not None and self._last_polyline_count == len(self.polylines):
+        # Check if cache is valid: same polylines, none edited since
+        bbox_key = tuple(polyline.revision for polyline in self.polylines)
+        if bbox_key == self._bbox_key:
             return self._bbox_cache
             
-        # Calculate bounding box
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-        
-        for polyline in self.polylines:
-            for point in polyline.points:
-                min_x = min(min_x, point[0])
-                min_y = min(min_y, point[1])
-                max_x = max(max_x, point[0])
-                max_y = max(max_y, point[1])
+        # Combine the polylines' own cached boxes; only edited polylines rescan their points
+        boxes = [polyline.bbox for polyline in self.polylines]
+        boxes = [box for box in boxes if box is not None]
         
-        if min_x == float('inf'):
+        if not boxes:
             self._bbox_cache = None
         else:
-            self._bbox_cache = (min_x, min_y, max_x, max_y)
+            min_xs, min_ys, max_xs, max_ys = zip(*boxes)
+            self._bbox_cache = (min(min_xs), min(min_ys), max(max_xs), max(max_ys))
         
-        self._last_polyline_count = len(self.polylines)
+        self._bbox_key = bbox_key
         return self._bbox_cache
     
     def invalidate_cache(self):
         """Invalidate the bounding box cache"""
         self._bbox_cache = None
-        self._last_polyline_count = 0
+        self._bbox_key = None
+
+def _refresh_sections_table(self):
+    """Refresh the sections table, debounced through the main window when it provides the hook"""
+    refresh = getattr(self, 'update_sections_table', None)
+    if refresh is not None:
+        refresh()
+    else:
+        update_sections_table(self)
+
+def _refresh_section_filter(self):
+    """Refresh the section filter dropdowns, debounced through the main window when it provides the hook"""
+    refresh = getattr(self, 'update_section_filter_dropdown', None)
+    if refresh is not None:
+        refresh()
+    else:
+        update_section_filter_dropdown(self)
 
 def move_section_up(self):
     """Move the selected section up in the list"""
     if not self.sections_panel.sections_table:
         return
-    selected = self.sections_panel.sections_table.currentRow()
+    selected = self.sections_panel.sections_table.currentIndex().row()
     if selected > 0:
         self.sections_list[selected-1], self.sections_list[selected] = self.sections_list[selected], self.sections_list[selected-1]
-        # Use debounced update
-        if hasattr(self, 'update_sections_table'):
-            self.update_sections_table()
-        else:
-            update_sections_table(self)
+        # Order decides which overlapping section wins
+        invalidate_section_assignment_cache(self)
+        # Only the two affected rows change
+        self.sections_panel.sections_model.refresh_rows(selected - 1, selected)
         self.sections_panel.sections_table.selectRow(selected-1)
-        if hasattr(self, 'update_section_filter_dropdown'):
-            self.update_section_filter_dropdown()
-        else:
-            update_section_filter_dropdown(self)
+        _refresh_section_filter(self)
 
 def move_section_down(self):
     """Move the selected section down in the list"""
     if not self.sections_panel.sections_table:
         return
-    selected = self.sections_panel.sections_table.currentRow()
+    selected = self.sections_panel.sections_table.currentIndex().row()
     if 0 <= selected < len(self.sections_list)-1:
         self.sections_list[selected+1], self.sections_list[selected] = self.sections_list[selected], self.sections_list[selected+1]
-        # Use debounced update
-        if hasattr(self, 'update_sections_table'):
-            self.update_sections_table()
-        else:
-            update_sections_table(self)
+        # Order decides which overlapping section wins
+        invalidate_section_assignment_cache(self)
+        # Only the two affected rows change
+        self.sections_panel.sections_model.refresh_rows(selected, selected + 1)
         self.sections_panel.sections_table.selectRow(selected+1)
-        if hasattr(self, 'update_section_filter_dropdown'):
-            self.update_section_filter_dropdown()
-        else:
-            update_section_filter_dropdown(self)
+        _refresh_section_filter(self)
 
 def import_sections_csv(self):
     """Import sections from a CSV file"""
-    import csv
-    
     file_path, _ = QFileDialog.getOpenFileName(self, "Import Sections from CSV", "", "CSV Files (*.csv)")
     if file_path:
         try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                existing_names = set(section.name for section in self.sections_list)
-                
-                for row in reader:
-                    if row and row[0].strip():
-                        section_name = row[0].strip()
-                        
-                        # Skip if section name already exists
-                        if section_name in existing_names:
-                            continue
-                        
-                        # Create new section
-                        new_section = Section(section_name)
-                        
-                        # Try to parse line size data if available
-                        if len(row) > 1 and row[1].strip():
-                            try:
-                                new_section.line_size = float(row[1].strip())
-                            except ValueError:
-                                pass  # Invalid number, keep as None
-                        
-                        self.sections_list.append(new_section)
-                        existing_names.add(section_name)
-            
-            # Use debounced updates
-            if hasattr(self, 'update_sections_table'):
-                self.update_sections_table()
-            else:
-                update_sections_table(self)
-            if hasattr(self, 'update_section_filter_dropdown'):
-                self.update_section_filter_dropdown()
-            else:
-                update_section_filter_dropdown(self)
+            # Views refresh once when the batch ends, not per imported row
+            with batched_section_updates(self), open(file_path, newline='', encoding='utf-8') as csvfile:
+                # First occurrence of each new name wins; existing names are skipped
+                existing_names = get_section_names(self)
+                imported: Dict[str, Optional[float]] = {}
+                for row in csv.reader(csvfile):
+                    section_name = row[0].strip() if row else ""
+                    if section_name and section_name not in existing_names and section_name not in imported:
+                        imported[sys.intern(section_name)] = _parse_line_size(row[1]) if len(row) > 1 else None
+                self.sections_list.extend(
+                    [Section(name, line_size=line_size) for name, line_size in imported.items()]
+                )
+                existing_names.update(imported)
+                if imported:
+                    invalidate_section_assignment_cache(self)
             
         except Exception as e:
             QMessageBox.warning(self, "Import Error", f"Failed to import CSV file: {str(e)}")
 
+@contextmanager
+def batched_section_updates(self):
+    """Suppress section table and filter refreshes inside the block, then refresh once on exit"""
+    self._section_batch_depth += 1
+    try:
+        yield
+    finally:
+        self._section_batch_depth -= 1
+        if self._section_batch_depth == 0:
+            # Use debounced updates
+            _refresh_sections_table(self)
+            _refresh_section_filter(self)
+
+def get_section_names(self) -> Set[str]:
+    """Return the set of current section names, rebuilt only after invalidation"""
+    if self._section_names is None:
+        self._section_names = {section.name for section in self.sections_list}
+    return self._section_names
+
+def invalidate_section_names(self):
+    """Drop the section name index after sections are removed, renamed or replaced"""
+    self._section_names = None
+    self._name_counters.clear()
+
+def register_section_name(self, name: str):
+    """Record the name of a newly appended section in the name index"""
+    if self._section_names is not None:
+        self._section_names.add(name)
+
+@lru_cache(maxsize=256)
+def _parse_line_size(text: str) -> Optional[float]:
+    """Parse an imported line size, returning None for blank or invalid values"""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
 def update_sections_table(self):
     """Update the sections table - this function now uses debouncing through the main window"""
-    if not self.sections_panel.sections_table:
+    model = self.sections_panel.sections_model
+    if model is None:
         return
-    self.sections_panel.sections_table.blockSignals(True)
-    self.sections_panel.sections_table.setRowCount(len(self.sections_list))
-    for i, section in enumerate(self.sections_list):
-        # Section name
-        name_item = QTableWidgetItem(section.name)
-        name_item.setFlags(name_item.flags() | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        self.sections_panel.sections_table.setItem(i, 0, name_item)
-        
-        # Line size
-        mm_text = f"{section.line_size:.2f}" if section.line_size is not None else ""
-        mm_item = QTableWidgetItem(mm_text)
-        mm_item.setFlags(mm_item.flags() | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        self.sections_panel.sections_table.setItem(i, 1, mm_item)
-        
-        # Color
-        color_item = QTableWidgetItem()
-        if section.color:
-            color_item.setBackground(section.color)
-            color_item.setText(section.color.name())
-        else:
-            color_item.setText("Auto")
-        color_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        self.sections_panel.sections_table.setItem(i, 2, color_item)
-    self.sections_panel.sections_table.blockSignals(False)
+    # The model reads sections on demand; only row count changes and repaints are signalled
+    model.refresh()
 
-def handle_section_edit(self, item):
-    """Handle editing of section table items"""
-    if not self.sections_panel.sections_table:
-        return
-    row = item.row()
-    col = item.column()
-    text = item.text().strip()
-    
+def handle_section_edit(self, row: int, col: int, text: str) -> bool:
+    """Apply an edit made in the sections table; returns False if the edit was rejected"""
     if row >= len(self.sections_list):
-        return
+        return False
         
     section = self.sections_list[row]
     
     if col == 0:  # Section name
         if not text:
             # Prevent empty names
-            if hasattr(self, 'update_sections_table'):
-                self.update_sections_table()
-            else:
-                update_sections_table(self)
-            return
+            return False
         section.name = text
+        invalidate_section_names(self)
     elif col == 1:  # Line size
         if text:
             try:
@@ -247,11 +317,7 @@ def handle_section_edit(self, item):
                         QMessageBox.StandardButton.No
                     )
                     if reply != QMessageBox.StandardButton.Yes:
-                        if hasattr(self, 'update_sections_table'):
-                            self.update_sections_table()
-                        else:
-                            update_sections_table(self)
-                        return
+                        return False
                 section.line_size = value
             except ValueError:
                 # Invalid number, revert
@@ -260,19 +326,25 @@ def handle_section_edit(self, item):
                     "Invalid Input",
                     "Please enter a valid number for line size."
                 )
-                if hasattr(self, 'update_sections_table'):
-                    self.update_sections_table()
-                else:
-                    update_sections_table(self)
-                return
+                return False
         else:
             section.line_size = None
     
-    # Update the table to reflect the calculated values
-    if hasattr(self, 'update_sections_table'):
-        self.update_sections_table()
-    else:
-        update_sections_table(self)
+    invalidate_section_assignment_cache(self)
+    schedule_section_reassignment(self)
+    return True
+
+def schedule_section_reassignment(self):
+    """Reassign detections to sections once edits settle; each call restarts the wait"""
+    timer = getattr(self, '_pending_reassign_timer', None)
+    if timer is None:
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: _reassign_sections(self))
+        self._pending_reassign_timer = timer
+    timer.start(SECTION_REASSIGN_DELAY_MS)
+
+def _reassign_sections(self):
     invalidate_section_assignment_cache(self)
     assign_objects_to_sections(self)
 
@@ -280,21 +352,41 @@ def update_section_filter_dropdown(self):
     """Update the section filter dropdown with current section names"""
     if hasattr(self, 'section_filter_dropdown'):
         self.section_filter_dropdown.clear()
-        self.section_filter_dropdown.addItem("All")
-        for section in self.sections_list:
-            self.section_filter_dropdown.addItem(section.name)
+        self.section_filter_dropdown.addItems(["All"] + [section.name for section in self.sections_list])
+
+def _highest_name_suffix(base_name: str, sections_list: List['Section']) -> int:
+    """Return the highest n among sections named "<base_name> <n>", or 0"""
+    pattern = re.compile(rf"{re.escape(base_name)} (\d+)")
+    highest = 0
+    for section in sections_list:
+        match = pattern.fullmatch(section.name)
+        if match:
+            highest = max(highest, int(match.group(1)))
+    return highest
+
+def next_numbered_section_name(self, base_name: str) -> str:
+    """Return an unused "<base_name> <n>", continuing from the last number handed out"""
+    names = get_section_names(self)
+    i = self._name_counters.get(base_name)
+    if i is None:
+        i = _highest_name_suffix(base_name, self.sections_list) + 1
+    while f"{base_name} {i}" in names:
+        i += 1
+    # Resume from this number next time; it is skipped once the name is taken,
+    # and reused if the caller ends up not creating the section
+    self._name_counters[base_name] = i
+    return f"{base_name} {i}"
 
 def add_section_with_points(self, points):
+    # Imported here: importing the ui package loads the PDF viewer and its
+    # rendering dependencies, which section logic shouldn't need
     from ui.dialogs.section_dialog import SectionDialog
-    base_name = "New Section"
     existing_names = [section.name for section in self.sections_list]
-    i = 1
-    while f"{base_name} {i}" in existing_names:
-        i += 1
-    new_name = f"{base_name} {i}"
+    new_name = next_numbered_section_name(self, "New Section")
     color_index = len(self.sections_list)
     default_color = get_next_rainbow_color(color_index)
-    initial_polylines = [Polyline(points, getattr(self, 'current_page', 1))]
+    page = self.pdf_viewer.current_page + 1
+    initial_polylines = [Polyline(points, page)]
     dialog = SectionDialog(self, new_name, None, default_color, polylines=initial_polylines, existing_section_names=existing_names, existing_sections=self.sections_list)
     if not dialog.exec():
         return  # User cancelled
@@ -305,21 +397,16 @@ def add_section_with_points(self, points):
         if section.name == name:
             # Add the new polyline(s) to the existing section, set line size and color to match
             for poly in polylines:
-                poly.page = getattr(self, 'current_page', 1)
+                poly.page = page
                 section.polylines.append(poly)
             # Use debounced updates
-            if hasattr(self, 'update_sections_table'):
-                self.update_sections_table()
-            else:
-                update_sections_table(self)
-            if hasattr(self, 'update_section_filter_dropdown'):
-                self.update_section_filter_dropdown()
-            else:
-                update_section_filter_dropdown(self)
+            _refresh_sections_table(self)
+            _refresh_section_filter(self)
             if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
                 self.viewer_panel.pdf_viewer.set_sections(self.sections_list)
             if self.sections_panel.sections_table:
                 self.sections_panel.sections_table.selectRow(self.sections_list.index(section))
+            invalidate_section_assignment_cache(self)
             assign_objects_to_sections(self)
             return
     # Otherwise, create a new section
@@ -327,15 +414,10 @@ def add_section_with_points(self, points):
     color = dialog.get_color()
     new_section = Section(name, line_size=line_size, polylines=polylines, color=color)
     self.sections_list.append(new_section)
+    register_section_name(self, name)
     # Use debounced updates
-    if hasattr(self, 'update_sections_table'):
-        self.update_sections_table()
-    else:
-        update_sections_table(self)
-    if hasattr(self, 'update_section_filter_dropdown'):
-        self.update_section_filter_dropdown()
-    else:
-        update_section_filter_dropdown(self)
+    _refresh_sections_table(self)
+    _refresh_section_filter(self)
     if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
         self.viewer_panel.pdf_viewer.set_sections(self.sections_list)
     if self.sections_panel.sections_table:
@@ -345,82 +427,80 @@ def add_section_with_points(self, points):
 
 def show_section_context_menu(self, section_index: int, global_pos=None):
     """Show context menu for section operations"""
-    from PySide6.QtWidgets import QMenu, QColorDialog
-    from PySide6.QtCore import QPoint
-    
     if section_index < 0 or section_index >= len(self.sections_list):
         return
     
-    section = self.sections_list[section_index]
+    menu = _get_section_context_menu(self)
+    # The cached actions act on whichever section the menu was last opened for
+    self._section_menu_index = section_index
+    self._section_menu_paste_action.setEnabled(getattr(self, '_section_clipboard', None) is not None)
     
-    if hasattr(self, '_section_clipboard'):
-        clipboard = self._section_clipboard
+    if global_pos is not None:
+        menu.exec(global_pos)
     else:
-        clipboard = None
-    
+        if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
+            cursor_pos = self.viewer_panel.pdf_viewer.mapToGlobal(QPoint(0, 0))
+        else:
+            cursor_pos = QPoint(0, 0)
+        menu.exec(cursor_pos)
+
+def _get_section_context_menu(self):
+    """Build the section context menu on first use and reuse it afterwards"""
+    menu = getattr(self, '_section_menu', None)
+    if menu is not None:
+        return menu
     menu = QMenu(self)
     
     # Edit Section action
     edit_action = menu.addAction("Edit Section")
-    edit_action.triggered.connect(lambda: edit_section_points(self, section_index))
+    edit_action.triggered.connect(lambda: edit_section_points(self, self._section_menu_index))
     
     menu.addSeparator()
     
     # Cut/Copy/Paste actions
     cut_action = menu.addAction("Cut Section")
-    cut_action.triggered.connect(lambda: cut_section(self, section_index))
+    cut_action.triggered.connect(lambda: cut_section(self, self._section_menu_index))
     
     copy_action = menu.addAction("Copy Section")
-    copy_action.triggered.connect(lambda: copy_section(self, section_index))
+    copy_action.triggered.connect(lambda: copy_section(self, self._section_menu_index))
     
     paste_action = menu.addAction("Paste Section")
     paste_action.triggered.connect(lambda: paste_section(self))
-    paste_action.setEnabled(hasattr(self, '_section_clipboard') and self._section_clipboard is not None)
     
     menu.addSeparator()
     
     # Change Color action
     color_action = menu.addAction("Change Color")
-    color_action.triggered.connect(lambda: change_section_color(self, section_index))
+    color_action.triggered.connect(lambda: change_section_color(self, self._section_menu_index))
     
     menu.addSeparator()
     
     # Delete action
     delete_action = menu.addAction("Delete Section")
-    delete_action.triggered.connect(lambda: delete_section_from_context(self, section_index))
+    delete_action.triggered.connect(lambda: delete_section_from_context(self, self._section_menu_index))
     
-    if global_pos is not None:
-        menu.exec(global_pos)
-    else:
-        if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
-            cursor_pos = self.viewer_panel.pdf_viewer.mapToGlobal(QPoint(0, 0))
-        else:
-            cursor_pos = QPoint(0, 0)
-        menu.exec(cursor_pos)
+    self._section_menu = menu
+    self._section_menu_paste_action = paste_action
+    return menu
 
 def edit_section_points(self, section_index: int):
     """Edit the polylines of a section"""
+    from ui.dialogs.section_dialog import SectionDialog
     if section_index < 0 or section_index >= len(self.sections_list):
         return
     section = self.sections_list[section_index]
-    from ui.dialogs.section_dialog import SectionDialog
     dialog = SectionDialog(self, section.name, section.line_size, section.color, polylines=list(section.polylines))
     if not dialog.exec():
         return  # User cancelled
     section.name = dialog.get_name()
+    invalidate_section_names(self)
     section.line_size = dialog.get_line_size()
     section.color = dialog.get_color()
     section.polylines = dialog.get_polylines()
     section.invalidate_cache()  # Invalidate bounding box cache
     # Use debounced updates
-    if hasattr(self, 'update_sections_table'):
-        self.update_sections_table()
-    else:
-        update_sections_table(self)
-    if hasattr(self, 'update_section_filter_dropdown'):
-        self.update_section_filter_dropdown()
-    else:
-        update_section_filter_dropdown(self)
+    _refresh_sections_table(self)
+    _refresh_section_filter(self)
     if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
         self.viewer_panel.pdf_viewer.set_sections(self.sections_list)
     invalidate_section_assignment_cache(self)
@@ -440,36 +520,28 @@ def copy_section(self, section_index: int):
         return
     
     section = self.sections_list[section_index]
-    self._section_clipboard = copy.deepcopy(section)
+    self._section_clipboard = section.clone()
 
 def paste_section(self):
     """Paste a section from clipboard"""
     if not hasattr(self, '_section_clipboard') or self._section_clipboard is None:
         return
     
-    copied_section = copy.deepcopy(self._section_clipboard)
+    copied_section = self._section_clipboard.clone()
     
     # Generate unique name
     base_name = copied_section.name.split()[0]
-    existing_names = set(section.name for section in self.sections_list)
-    i = 1
-    while f"{base_name} {i}" in existing_names:
-        i += 1
-    new_name = f"{base_name} {i}"
+    new_name = next_numbered_section_name(self, base_name)
     color_index = len(self.sections_list)
     copied_section.name = new_name
     copied_section.color = get_next_rainbow_color(color_index)
     copied_section.invalidate_cache()  # Ensure cache is invalidated for new section
     self.sections_list.append(copied_section)
+    register_section_name(self, new_name)
+    invalidate_section_assignment_cache(self)
     # Use debounced updates
-    if hasattr(self, 'update_sections_table'):
-        self.update_sections_table()
-    else:
-        update_sections_table(self)
-    if hasattr(self, 'update_section_filter_dropdown'):
-        self.update_section_filter_dropdown()
-    else:
-        update_section_filter_dropdown(self)
+    _refresh_sections_table(self)
+    _refresh_section_filter(self)
     
     # Update the PDF viewer
     if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
@@ -482,19 +554,15 @@ def change_section_color(self, section_index: int):
     
     section = self.sections_list[section_index]
     
-    from PySide6.QtWidgets import QColorDialog
-    from PySide6.QtGui import QColor
-    
     current_color = section.color if section.color else QColor(Qt.GlobalColor.blue)
     new_color = QColorDialog.getColor(current_color, self, "Choose Section Color")
     
     if new_color.isValid():
         section.color = new_color
+        # Detections take their color from the section they're assigned to
+        invalidate_section_assignment_cache(self)
         # Use debounced update
-        if hasattr(self, 'update_sections_table'):
-            self.update_sections_table()
-        else:
-            update_sections_table(self)
+        _refresh_sections_table(self)
         
         # Update the PDF viewer
         if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
@@ -507,7 +575,6 @@ def delete_section_from_context(self, section_index: int):
     
     section = self.sections_list[section_index]
     
-    from PySide6.QtWidgets import QMessageBox
     reply = QMessageBox.question(
         self,
         "Delete Section",
@@ -518,48 +585,56 @@ def delete_section_from_context(self, section_index: int):
     
     if reply == QMessageBox.StandardButton.Yes:
         del self.sections_list[section_index]
+        invalidate_section_names(self)
+        invalidate_section_assignment_cache(self)
         # Use debounced updates
-        if hasattr(self, 'update_sections_table'):
-            self.update_sections_table()
-        else:
-            update_sections_table(self)
-        if hasattr(self, 'update_section_filter_dropdown'):
-            self.update_section_filter_dropdown()
-        else:
-            update_section_filter_dropdown(self)
+        _refresh_sections_table(self)
+        _refresh_section_filter(self)
         
         # Update the PDF viewer
         if hasattr(self, 'viewer_panel') and self.viewer_panel.pdf_viewer:
             self.viewer_panel.pdf_viewer.set_sections(self.sections_list)
 
-def get_section_for_bbox_optimized(bbox, sections_list, section_bbox_cache: Optional[Dict[str, Optional[Tuple[float, float, float, float]]]] = None):
-    """Optimized version that uses bounding box checks before expensive intersection tests."""
-    x1, y1, x2, y2 = bbox
-    
-    # Use provided cache or calculate on demand
-    if section_bbox_cache is None:
-        section_bbox_cache = {section.name: section.get_bounding_box() for section in sections_list}
-    
-    # Check sections in reverse order (most recently added first)
+def build_section_candidates(sections_list, section_bbox_cache: Optional[Dict[str, Optional[Tuple[float, float, float, float]]]] = None) -> List[Tuple['Section', Tuple[float, float, float, float]]]:
+    """Return (section, bounding box) pairs to test bboxes against, most recently added first.
+
+    Sections without any points have no bounding box and can never match, so they are left out.
+    """
+    candidates = []
     for section in reversed(sections_list):
-        section_bbox = section_bbox_cache.get(section.name)
-        
-        # Quick bounding box check first
-        if section_bbox is not None:
-            sx1, sy1, sx2, sy2 = section_bbox
-            # Check if bounding boxes overlap
-            if not (x2 < sx1 or x1 > sx2 or y2 < sy1 or y1 > sy2):
-                # Bounding boxes overlap, do detailed intersection test
-                for polyline in getattr(section, 'polylines', []):
-                    if polyline_intersects_bbox(polyline.points, bbox):
-                        return section.name
+        if section_bbox_cache is not None:
+            section_bbox = section_bbox_cache.get(section.name)
         else:
-            # No bounding box (empty section), do detailed test
-            for polyline in getattr(section, 'polylines', []):
-                if polyline_intersects_bbox(polyline.points, bbox):
-                    return section.name
-    
-    return "Unassigned"
+            section_bbox = section.get_bounding_box()
+        if section_bbox is not None:
+            candidates.append((section, section_bbox))
+    return candidates
+
+def find_section_for_bbox(bbox, candidates) -> Optional['Section']:
+    """Return the first candidate section with a polyline crossing the bbox, or None."""
+    x1, y1, x2, y2 = bbox
+    for section, (sx1, sy1, sx2, sy2) in candidates:
+        # Quick bounding box check first
+        if x2 < sx1 or x1 > sx2 or y2 < sy1 or y1 > sy2:
+            continue
+        # Bounding boxes overlap, do detailed intersection test on polylines whose own box overlaps
+        for polyline in section.polylines:
+            polyline_bbox = polyline.bbox
+            if polyline_bbox is None:
+                continue
+            px1, py1, px2, py2 = polyline_bbox
+            if x2 < px1 or x1 > px2 or y2 < py1 or y1 > py2:
+                continue
+            if polyline_intersects_bbox(polyline.points, bbox):
+                return section
+    return None
+
+def get_section_for_bbox_optimized(bbox, sections_list, section_bbox_cache: Optional[Dict[str, Optional[Tuple[float, float, float, float]]]] = None):
+    """Optimized version that uses bounding box checks before expensive intersection tests."""
+    if not sections_list:
+        return "Unassigned"
+    section = find_section_for_bbox(bbox, build_section_candidates(sections_list, section_bbox_cache))
+    return section.name if section is not None else "Unassigned"
 
 def get_section_for_bbox(bbox, sections_list):
     """Return the name of the most recently added section whose any polyline crosses the bbox, or 'Unassigned'."""
@@ -570,107 +645,39 @@ def assign_objects_to_sections(self):
     if not hasattr(self, 'detections') or not hasattr(self, 'sections_list'):
         return
     
-    # Initialize cache if not exists
-    if not hasattr(self, '_section_assignment_cache'):
-        self._section_assignment_cache = {}
-        self._last_sections_hash = None
-        self._last_detections_hash = None
-    
-    # Calculate hash of current state for cache validation
-    sections_hash = hash(tuple((s.name, len(s.polylines)) for s in self.sections_list))
-    detections_hash = hash(tuple((d.bbox, getattr(d, 'page_num', 0)) for d in self.detections))
-    
-    # Check if cache is still valid
-    if (self._last_sections_hash == sections_hash and 
-        self._last_detections_hash == detections_hash and 
-        self._section_assignment_cache):
-        # Cache is valid, apply cached assignments
-        for det in self.detections:
-            cache_key = (det.bbox, getattr(det, 'page_num', 0))
-            if cache_key in self._section_assignment_cache:
-                section_name, color = self._section_assignment_cache[cache_key]
-                det.section = section_name
-                det.color = color
+    # Assignments are still valid if neither sections nor detections changed since the last pass
+    versions = (self._sections_version, self._detections_version)
+    if versions == self._assigned_versions:
         return
     
-    # Cache is invalid, recalculate everything
-    self._section_assignment_cache.clear()
-    
-    # Pre-calculate section bounding boxes
-    section_bbox_cache = {}
-    for section in self.sections_list:
-        section_bbox_cache[section.name] = section.get_bounding_box()
+    # Without sections there is nothing to index or test against
+    if not self.sections_list:
+        for det in self.detections:
+            det.section = "Unassigned"
+            det.color = None
+        self._assigned_versions = versions
+        return
     
-    # Create section name to color mapping
-    section_colors = {section.name: section.color for section in self.sections_list}
+    # Index the section polylines once for all detections
+    section_index = SectionIndex(self.sections_list)
     
     # Process all detections
     for det in self.detections:
-        # Get section assignment
-        section_name = get_section_for_bbox_optimized(det.bbox, self.sections_list, section_bbox_cache)
-        det.section = section_name
-        
-        # Set color
-        det.color = section_colors.get(section_name)
-        
-        # Cache the result
-        cache_key = (det.bbox, getattr(det, 'page_num', 0))
-        self._section_assignment_cache[cache_key] = (section_name, det.color)
+        # Get section assignment and its color
+        section = section_index.find(det.bbox, det.page_num)
+        if section is not None:
+            det.section = section.name
+            det.color = section.color
+        else:
+            det.section = "Unassigned"
+            det.color = None
     
-    # Update cache state
-    self._last_sections_hash = sections_hash
-    self._last_detections_hash = detections_hash
+    self._assigned_versions = versions
 
 def invalidate_section_assignment_cache(self):
     """Invalidate the section assignment cache when sections change."""
-    if hasattr(self, '_section_assignment_cache'):
-        self._section_assignment_cache.clear()
-        self._last_sections_hash = None
-        self._last_detections_hash = None
-
-def polyline_intersects_bbox(points, bbox):
-    """Return True if any segment of the polyline intersects the bbox."""
-    if not points or len(points) < 2:
-        return False
-    x1, y1, x2, y2 = bbox
-    for i in range(len(points) - 1):
-        if segment_intersects_rect(points[i], points[i+1], x1, y1, x2, y2):
-            return True
-    return False
-
-def segment_intersects_rect(p1, p2, x1, y1, x2, y2):
-    """Check if a line segment (p1, p2) intersects a rectangle (x1, y1, x2, y2)."""
-    from PySide6.QtCore import QLineF
-    edges = [
-        QLineF(x1, y1, x2, y1),  # top
-        QLineF(x2, y1, x2, y2),  # right
-        QLineF(x2, y2, x1, y2),  # bottom
-        QLineF(x1, y2, x1, y1),  # left
-    ]
-    seg = QLineF(p1[0], p1[1], p2[0], p2[1])
-    for edge in edges:
-        intersect_type, _ = seg.intersects(edge)
-        # Compare by name to avoid enum/int issues
-        if hasattr(intersect_type, 'name') and intersect_type.name == 'BoundedIntersection':
-            return True
-    if (x1 <= p1[0] <= x2 and y1 <= p1[1] <= y2) or (x1 <= p2[0] <= x2 and y1 <= p2[1] <= y2):
-        return True
-    return False
-
-def point_in_polygon(point, poly):
-    """Ray casting algorithm for point-in-polygon test."""
-    x, y = point
-    n = len(poly)
-    inside = False
-    if n < 3:
-        return False
-    px1, py1 = poly[0]
-    for i in range(n+1):
-        px2, py2 = poly[i % n]
-        if min(py1, py2) < y <= max(py1, py2) and x <= max(px1, px2):
-            if py1 != py2:
-                xinters = (y - py1) * (px2 - px1) / (py2 - py1) + px1
-            if px1 == px2 or x <= xinters:
-                inside = not inside
-        px1, py1 = px2, py2
-    return inside
\ No newline at end of file
+    self._sections_version += 1
+
+def mark_detections_changed(self):
+    """Invalidate the section assignment cache when detections are added, removed or moved."""
+    self._detections_version += 1
@@ -1,4 +1,7 @@
 import pytest
+
+pytest.importorskip("PySide6")
+
 from PySide6.QtWidgets import QApplication
 from ..core.main_window import Spectra
 from ..config.settings import APP_TITLE
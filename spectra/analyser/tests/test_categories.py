@@ -0,0 +1,53 @@
+import pytest
+
+from detection.categories_map import (
+    FREQUENCY_CATEGORIES,
+    OBJECT_TO_FREQUENCY_CATEGORY,
+    get_all_categories,
+    get_all_frequency_categories,
+    get_category,
+    get_frequency_category,
+)
+
+
+@pytest.mark.parametrize("object_type, expected", [
+    ("Manual Valve", "Manual Valves"),
+    ("  MANUAL valve ", "Manual Valves"),
+    ("check valve", "Manual Valves"),
+    ("pipe", "Steel Pipes"),
+    # Direct category names match case-insensitively too
+    ("air cooler", "Air Cooler"),
+    ("Shell & Tube (Tube HC)", "Shell & Tube (Tube HC)"),
+    ("steel pipes", "Steel Pipes"),
+    ("Spectacle Blind", None),
+    ("", None),
+    (None, None),
+])
+def test_get_frequency_category(object_type, expected):
+    assert get_frequency_category(object_type) == expected
+
+
+def test_object_types_map_to_known_categories():
+    assert set(OBJECT_TO_FREQUENCY_CATEGORY.values()) <= set(FREQUENCY_CATEGORIES)
+
+
+@pytest.mark.parametrize("key, expected", [
+    (1, "Manual Valve"),
+    ("15", "Manual Valve"),
+    (" 16 ", "Relief Valve"),
+    (25, "Actuated Valve"),
+    ("Pneumatic Valve", "Actuated Valve"),
+    ("TWO WAY ON-OFF SOLENOID VALVE", "Actuated Valve"),
+    (33, "Unknown"),
+    ("valve", "Unknown"),
+    (None, "Unknown"),
+])
+def test_get_category(key, expected):
+    assert get_category(key) == expected
+
+
+def test_category_lists():
+    assert get_all_frequency_categories() == tuple(FREQUENCY_CATEGORIES)
+    categories = get_all_categories()
+    assert categories == sorted(set(categories))
+    assert "Instrument" in categories and "Unknown" not in categories
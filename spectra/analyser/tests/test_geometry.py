@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from sections.geometry import (
+    BoxGrid,
+    _clip_segment,
+    point_in_polygon,
+    polyline_intersects_bbox,
+    segment_intersects_rect,
+)
+
+RECT = (0, 0, 10, 10)
+
+
+@pytest.mark.parametrize("p1, p2, expected", [
+    ((-5, 5), (15, 5), True),     # straight through
+    ((5, 5), (20, 20), True),     # starts inside
+    ((10, 5), (20, 5), True),     # endpoint on the right edge
+    ((-1, 1), (1, -1), True),     # diagonal touching the corner
+    ((-1, 0.5), (0.5, -1), False),  # diagonal just missing the corner
+    ((-5, 0), (15, 0), True),     # collinear with the top edge
+    ((-5, -1), (15, -1), False),  # parallel to the top edge, outside
+    ((0, -5), (0, 15), True),     # collinear with the left edge
+    ((-5, -5), (-5, 15), False),  # parallel to the left edge, outside
+    ((-5, 20), (20, -5), True),   # long diagonal crossing two edges
+    ((11, 11), (11, 11), False),  # degenerate point outside
+])
+def test_segment_intersects_rect(p1, p2, expected):
+    assert segment_intersects_rect(p1, p2, *RECT) is expected
+    assert segment_intersects_rect(p2, p1, *RECT) is expected
+
+
+def test_clip_segment_parallel_and_crossing():
+    # Both endpoints outside, as the callers guarantee
+    assert _clip_segment(-5, 5, 15, 5, *RECT)
+    assert _clip_segment(5, -5, 5, 15, *RECT)
+    assert not _clip_segment(-5, 11, 15, 11, *RECT)
+    assert not _clip_segment(11, -5, 11, 15, *RECT)
+    assert not _clip_segment(-5, 8, 8, -5, 0, 10, 10, 20)
+
+
+def test_polyline_intersects_bbox():
+    polyline = [(-10, -10), (-10, 20), (20, 20)]
+    assert not polyline_intersects_bbox(polyline, RECT)
+    assert polyline_intersects_bbox(polyline + [(5, 5)], RECT)
+    # Corners may come in either order
+    assert polyline_intersects_bbox([(-5, 5), (15, 5)], (10, 10, 0, 0))
+    assert not polyline_intersects_bbox([(5, 5)], RECT)
+    assert not polyline_intersects_bbox([], RECT)
+
+
+def test_point_in_polygon():
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    assert point_in_polygon((5, 5), square)
+    assert not point_in_polygon((15, 5), square)
+    assert not point_in_polygon((5, -1), square)
+    # U shape: the notch between the arms is outside
+    u_shape = [(0, 0), (10, 0), (10, 10), (7, 10), (7, 3), (3, 3), (3, 10), (0, 10)]
+    assert point_in_polygon((1, 8), u_shape)
+    assert not point_in_polygon((5, 8), u_shape)
+    assert point_in_polygon((5, 1), u_shape)
+    assert not point_in_polygon((5, 5), [(0, 0), (10, 10)])
+
+
+def _overlaps(a, b):
+    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+
+def test_box_grid_returns_every_overlapping_box():
+    rng = random.Random(7)
+    boxes = []
+    for _ in range(200):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+        boxes.append((x, y, x + rng.uniform(0, 80), y + rng.uniform(0, 80)))
+    grid = BoxGrid(boxes)
+    for _ in range(200):
+        x, y = rng.uniform(-100, 1100), rng.uniform(-100, 1100)
+        query = (x, y, x + rng.uniform(0, 150), y + rng.uniform(0, 150))
+        keys = list(grid.query(query))
+        assert keys == sorted(set(keys))
+        expected = {key for key, box in enumerate(boxes) if _overlaps(box, query)}
+        assert expected <= set(keys)
+
+
+def test_box_grid_touching_and_empty():
+    grid = BoxGrid([(0, 0, 10, 10), (20, 20, 20, 20)])
+    assert 0 in grid.query((10, 10, 15, 15))  # shares a corner
+    assert 1 in grid.query((15, 20, 20, 25))  # degenerate box on the query edge
+    # Reversed corners are normalized
+    assert 0 in grid.query((5, 5, 0, 0))
+    assert list(BoxGrid([]).query((0, 0, 10, 10))) == []
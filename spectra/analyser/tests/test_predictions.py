@@ -0,0 +1,27 @@
+import pytest
+
+# roboflow.py also defines the Qt analysis thread
+pytest.importorskip("PySide6")
+
+from detection.roboflow import parse_predictions
+
+
+def test_parse_predictions_converts_center_boxes():
+    predictions = [
+        {"x": 50, "y": 40, "width": 20, "height": 10, "class": "7", "confidence": 0.9, "extra": 1},
+        {"x": 10.5, "y": 10.5, "width": 5, "height": 3, "class": "flange", "confidence": 0.4},
+    ]
+    first, second = parse_predictions(predictions, 3)
+    assert (first.name, first.confidence, first.bbox, first.page_num) == ("7", 0.9, (40, 35, 60, 45), 3)
+    assert first.source == "model" and first.section == "Unassigned"
+    # Corners are truncated to ints
+    assert second.bbox == (8, 9, 13, 12)
+
+
+def test_parse_predictions_empty():
+    assert parse_predictions([], 1) == []
+
+
+def test_parse_predictions_requires_fields():
+    with pytest.raises(KeyError):
+        parse_predictions([{"x": 1, "y": 1, "width": 1, "height": 1, "class": "7"}], 1)
@@ -0,0 +1,62 @@
+import random
+from types import SimpleNamespace
+
+from sections.geometry import SectionIndex, polyline_intersects_bbox
+
+
+def _polyline(points, page):
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return SimpleNamespace(points=points, page=page, bbox=(min(xs), min(ys), max(xs), max(ys)))
+
+
+def _brute_force(sections, bbox, page):
+    """Most recently added section first, as assign_objects_to_sections expects"""
+    for section in reversed(sections):
+        for polyline in section.polylines:
+            if polyline.page not in (None, page) or len(polyline.points) < 2:
+                continue
+            if polyline_intersects_bbox(polyline.points, bbox):
+                return section
+    return None
+
+
+def _random_sections(rng, count):
+    sections = []
+    for i in range(count):
+        polylines = []
+        for _ in range(rng.randint(1, 3)):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            points = [(x, y)]
+            for _ in range(rng.randint(0, 4)):
+                x += rng.uniform(-150, 150)
+                y += rng.uniform(-150, 150)
+                points.append((x, y))
+            polylines.append(_polyline(points, rng.choice([1, 2, 3, None])))
+        sections.append(SimpleNamespace(name=f"Section {i}", polylines=polylines))
+    return sections
+
+
+def test_section_index_matches_reverse_scan():
+    rng = random.Random(3)
+    sections = _random_sections(rng, 40)
+    index = SectionIndex(sections)
+    for _ in range(500):
+        x, y = rng.uniform(-50, 1050), rng.uniform(-50, 1050)
+        bbox = (x, y, x + rng.uniform(1, 60), y + rng.uniform(1, 60))
+        page = rng.randint(1, 4)  # page 4 only has page-agnostic polylines
+        assert index.find(bbox, page) is _brute_force(sections, bbox, page)
+
+
+def test_section_index_pages():
+    first = SimpleNamespace(polylines=[_polyline([(0, 5), (10, 5)], 1)])
+    shared = SimpleNamespace(polylines=[_polyline([(5, 0), (5, 10)], None)])
+    later = SimpleNamespace(polylines=[_polyline([(0, 0), (10, 10)], 2)])
+    index = SectionIndex([first, shared, later])
+    bbox = (4, 4, 6, 6)
+    assert index.find(bbox, 2) is later
+    assert index.find(bbox, 1) is shared
+    assert index.find(bbox, 7) is shared
+    assert index.find((20, 20, 30, 30), 1) is None
+    assert SectionIndex([first]).find(bbox, 2) is None
+    assert SectionIndex([]).find(bbox, 1) is None
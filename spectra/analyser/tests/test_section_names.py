@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from sections.sections import (
+    invalidate_section_names,
+    next_numbered_section_name,
+    register_section_name,
+)
+
+
+def _window(*names):
+    return SimpleNamespace(
+        sections_list=[SimpleNamespace(name=name) for name in names],
+        _section_names=None,
+        _name_counters={},
+    )
+
+
+def _add_section(window, name):
+    window.sections_list.append(SimpleNamespace(name=name))
+    register_section_name(window, name)
+
+
+def test_first_name_starts_at_one():
+    assert next_numbered_section_name(_window(), "New Section") == "New Section 1"
+
+
+def test_continues_after_highest_suffix():
+    window = _window("New Section 2", "New Section 7", "Other 9", "New Section 7b")
+    assert next_numbered_section_name(window, "New Section") == "New Section 8"
+    assert next_numbered_section_name(window, "Other") == "Other 10"
+
+
+def test_cancelled_name_is_reused_and_taken_name_skipped():
+    window = _window("New Section 1")
+    assert next_numbered_section_name(window, "New Section") == "New Section 2"
+    # Dialog cancelled: nothing was added, so the same name comes back
+    assert next_numbered_section_name(window, "New Section") == "New Section 2"
+    _add_section(window, "New Section 2")
+    assert next_numbered_section_name(window, "New Section") == "New Section 3"
+
+
+def test_base_name_is_matched_literally():
+    window = _window("A.B 4", "AxB 9")
+    assert next_numbered_section_name(window, "A.B") == "A.B 5"
+
+
+def test_invalidation_rescans_sections():
+    window = _window("New Section 5")
+    assert next_numbered_section_name(window, "New Section") == "New Section 6"
+    window.sections_list[:] = [SimpleNamespace(name="New Section 1")]
+    invalidate_section_names(window)
+    assert next_numbered_section_name(window, "New Section") == "New Section 2"
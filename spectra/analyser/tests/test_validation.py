@@ -0,0 +1,30 @@
+import pytest
+
+# The utils package re-exports Qt helpers alongside is_number
+pytest.importorskip("PySide6")
+
+from utils.validation import is_number
+
+
+@pytest.mark.parametrize("text", [
+    "0", "12", "-3", "2.5", "-0.75", "007",
+    # Not plain decimals, but float() accepts them
+    ".5", "5.", "+4", "1e3", "-2.5E-2", " 6 ", "inf", "nan",
+])
+def test_numbers(text):
+    assert is_number(text)
+
+
+@pytest.mark.parametrize("text", ["", "-", ".", "abc", "1.2.3", "1,5", "12a", "--1", "e5"])
+def test_non_numbers(text):
+    assert not is_number(text)
+
+
+@pytest.mark.parametrize("text", ["1", "-1.5", "1e3", ".5", "x", "", "1.2.3", "inf"])
+def test_matches_float(text):
+    try:
+        float(text)
+        expected = True
+    except ValueError:
+        expected = False
+    assert is_number(text) is expected
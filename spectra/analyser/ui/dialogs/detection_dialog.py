@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from PySide6.QtWidgets import (
     QComboBox,
@@ -11,13 +11,16 @@ from PySide6.QtWidgets import (
 )
 
 from detection.categories_map import get_all_frequency_categories
-from detection.types import Detection
+from utils.validation import is_number
+
+if TYPE_CHECKING:
+    from detection.types import Detection
 
 
 class DetectionDialog(QDialog):
     """Dialog for editing or creating detections"""
     
-    def __init__(self, main_window, detection: Optional[Detection] = None, prefill_section: Optional[str] = None, prefill_line_size: Optional[float] = None):
+    def __init__(self, main_window, detection: Optional['Detection'] = None, prefill_section: Optional[str] = None, prefill_line_size: Optional[float] = None):
         super().__init__(main_window)
         self.main_window = main_window
         self.detection = detection
@@ -30,6 +33,10 @@ class DetectionDialog(QDialog):
         self.line_size_edit = None
         self.count_edit = None
         self.ok_button = None
+        # Sections by name for the per-keystroke lookups; the dialog is modal, so they cannot change
+        self._section_by_name = {}
+        for section in main_window.sections_list:
+            self._section_by_name.setdefault(section.name, section)
         
         self.setWindowTitle("Edit Object" if self.is_edit_mode else "Add Object")
         self.setup_ui()
@@ -53,8 +60,7 @@ class DetectionDialog(QDialog):
         section_label = QLabel("Section:")
         layout.addWidget(section_label)
         self.section_combo = QComboBox()
-        section_names = [section.name for section in self.main_window.sections_list]
-        self.section_combo.addItems(section_names)
+        self.section_combo.addItems(list(self._section_by_name))
         self.section_combo.setEditable(True)
         layout.addWidget(self.section_combo)
         
@@ -88,6 +94,21 @@ class DetectionDialog(QDialog):
         
     def load_detection_data(self):
         """Load existing detection data if editing"""
+        # Fill the fields quietly and validate once at the end, not once per field
+        self.section_combo.blockSignals(True)
+        self.line_size_edit.blockSignals(True)
+        try:
+            self._fill_fields()
+        finally:
+            self.section_combo.blockSignals(False)
+            self.line_size_edit.blockSignals(False)
+            
+        # Initial validation
+        self.update_line_size_edit()
+        self.validate_line_size()
+        
+    def _fill_fields(self):
+        """Set the field values from the detection being edited, or the defaults for a new one"""
         if self.is_edit_mode and self.detection:
             if self.class_combo:
                 self.class_combo.setCurrentText(self.detection.name)
@@ -114,9 +135,6 @@ class DetectionDialog(QDialog):
                     self.line_size_edit.setText("")
             if self.count_edit:
                 self.count_edit.setText("1")
-            
-        # Initial validation
-        self.update_line_size_edit()
         
     def update_line_size_edit(self):
         """Update line size edit based on selected section"""
@@ -124,9 +142,7 @@ class DetectionDialog(QDialog):
             return
             
         section_name = self.section_combo.currentText().strip()
-        section = next(
-            (s for s in self.main_window.sections_list if s.name == section_name), None
-        )
+        section = self._section_by_name.get(section_name)
         if section and section.line_size is not None:
             self.line_size_edit.setText(f"{section.line_size:.2f}")
             self.ok_button.setEnabled(True)
@@ -139,20 +155,14 @@ class DetectionDialog(QDialog):
             return
             
         section_name = self.section_combo.currentText().strip()
-        section = next(
-            (s for s in self.main_window.sections_list if s.name == section_name), None
-        )
+        section = self._section_by_name.get(section_name)
         if section and section.line_size is not None:
             self.ok_button.setEnabled(True)
             return
             
         text = self.line_size_edit.text().strip()
-        try:
-            if text:  # Allow empty text
-                float(text)
-            self.ok_button.setEnabled(True)
-        except ValueError:
-            self.ok_button.setEnabled(False)
+        # Allow empty text
+        self.ok_button.setEnabled(not text or is_number(text))
             
     def get_class_name(self) -> str:
         """Get the selected class name"""
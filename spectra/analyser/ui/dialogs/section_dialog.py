@@ -13,12 +13,19 @@ from PySide6.QtWidgets import (
     QComboBox,
 )
 
+from utils.validation import is_number
+
 class SectionDialog(QDialog):
     def __init__(self, parent, name, line_size, color, polylines=None, existing_section_names=None, existing_sections=None):
         super().__init__(parent)
         self.setWindowTitle("Edit Section Properties")
         self.existing_section_names = existing_section_names or []
         self.existing_sections = existing_sections or []  # List of Section objects
+        # Name lookups run on every keystroke, so index names once
+        self._existing_name_set = set(self.existing_section_names)
+        self._sections_by_name = {}
+        for section in self.existing_sections:
+            self._sections_by_name.setdefault(section.name, section)
         self.name_combo = QComboBox()
         self.name_combo.setEditable(True)
         self.name_combo.addItems(self.existing_section_names)
@@ -31,6 +38,7 @@ class SectionDialog(QDialog):
         self.line_size_edit = QLineEdit(str(line_size) if line_size is not None else "")
         self.color = color
         self.color_button = QPushButton()
+        self._color_button_rgba = None  # Color the button's stylesheet was last built for; None is the default empty sheet
         self.update_color_button()
         self.ok_button = None
         self.polylines = polylines or []
@@ -71,6 +79,11 @@ class SectionDialog(QDialog):
         self.name_combo.currentTextChanged.connect(self.update_fields_enabled)
 
     def update_color_button(self):
+        # Setting a stylesheet makes Qt reparse it, so skip it when the color is unchanged
+        rgba = self.color.rgba() if self.color else None
+        if rgba == self._color_button_rgba:
+            return
+        self._color_button_rgba = rgba
         if self.color:
             self.color_button.setStyleSheet(f"background-color: {self.color.name()};")
         else:
@@ -84,21 +97,14 @@ class SectionDialog(QDialog):
 
     def validate(self):
         text = self.line_size_edit.text().strip()
-        if text:
-            try:
-                float(text)
-                if self.ok_button is not None:
-                    self.ok_button.setEnabled(True)
-                return
-            except ValueError:
-                pass
         if self.ok_button is not None:
-            self.ok_button.setEnabled(False)
+            self.ok_button.setEnabled(bool(text) and is_number(text))
 
     def populate_polyline_list(self):
         self.polyline_list.clear()
         for poly in self.polylines:
-            desc = f"Page {getattr(poly, 'page', '?')}, {len(getattr(poly, 'points', []))} points"
+            page = getattr(poly, 'page', '?')
+            desc = f"{'All pages' if page is None else f'Page {page}'}, {len(getattr(poly, 'points', []))} points"
             item = QListWidgetItem(desc)
             self.polyline_list.addItem(item)
         self.update_remove_button_state()
@@ -115,10 +121,10 @@ class SectionDialog(QDialog):
 
     def update_fields_enabled(self):
         name = self.name_combo.currentText().strip()
-        is_existing = name in self.existing_section_names
+        is_existing = name in self._existing_name_set
         if is_existing:
             # Find the section and update line size and color
-            section = next((s for s in self.existing_sections if s.name == name), None)
+            section = self._sections_by_name.get(name)
             if section:
                 self.line_size_edit.setText(str(section.line_size) if section.line_size is not None else "")
                 self.color = section.color
@@ -144,4 +150,4 @@ class SectionDialog(QDialog):
         return self.polylines
 
     def is_existing_section(self):
-        return self.get_name() in self.existing_section_names 
\ No newline at end of file
+        return self.get_name() in self._existing_name_set 
\ No newline at end of file
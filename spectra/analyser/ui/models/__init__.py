@@ -0,0 +1,9 @@
+"""
+Item models backing the main window's table views.
+"""
+
+from .detections_model import DetectionsTableModel
+from .results_model import ResultsTableModel
+from .sections_model import SectionsTableModel
+
+__all__ = ['DetectionsTableModel', 'ResultsTableModel', 'SectionsTableModel']
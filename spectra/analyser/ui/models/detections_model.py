@@ -0,0 +1,94 @@
+from typing import List
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class DetectionsTableModel(QAbstractTableModel):
+    """Read-only table model over the filtered detections shown in the objects panel
+
+    Cells are formatted on demand, so only the rows the view actually paints
+    cost anything. Line sizes fall back to the detection's section when the
+    detection has no override of its own.
+    """
+
+    HEADERS = [
+        "Object",
+        "Page",
+        "Section",
+        "X1,Y1",
+        "X2,Y2",
+        "Line Size [mm]",
+        "Count",
+        "Confidence",
+    ]
+
+    def __init__(self, sections_list: List, parent=None):
+        super().__init__(parent)
+        self._sections = sections_list  # Shared with the main window, which replaces its contents in place
+        self._rows = []
+        self._section_line_sizes = {}
+        self._row_by_id = {}
+
+    def set_rows(self, rows: List):
+        """Show a new list of detections"""
+        same_shape = len(rows) == len(self._rows)
+        if not same_shape:
+            self.beginResetModel()
+        # Copy so detections removed before the next refresh can't leave stale rows behind
+        self._rows = list(rows)
+        self._row_by_id = {id(detection): row for row, detection in enumerate(self._rows)}
+        # Built in reverse so a repeated name resolves to its first section, as a scan would
+        self._section_line_sizes = {section.name: section.line_size for section in reversed(self._sections)}
+        if not same_shape:
+            self.endResetModel()
+        elif rows:
+            # Same row count: repaint in place so the view keeps its scroll position and selection
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, self.columnCount() - 1))
+
+    def update_detection(self, detection) -> bool:
+        """Repaint the row showing `detection` after it changed in place; False if it isn't shown"""
+        row = self._row_by_id.get(id(detection))
+        if row is None:
+            return False
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1), [Qt.ItemDataRole.DisplayRole])
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        detection = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return detection.name
+        if column == 1:
+            return str(detection.page_num)
+        if column == 2:
+            return getattr(detection, "section", "Unassigned")
+        if column == 3:
+            return f"{detection.bbox[0]},{detection.bbox[1]}"
+        if column == 4:
+            return f"{detection.bbox[2]},{detection.bbox[3]}"
+        if column == 5:
+            line_size = self._line_size(detection)
+            return f"{line_size:.2f}" if line_size is not None else ""
+        if column == 6:
+            return str(getattr(detection, "count", 1))
+        return f"{detection.confidence:.3f}"
+
+    def _line_size(self, detection):
+        """Detection's own line size if set, else its section's"""
+        line_size = getattr(detection, "line_size", None)
+        if line_size is not None:
+            return line_size
+        return self._section_line_sizes.get(getattr(detection, "section", "Unassigned"))
@@ -0,0 +1,63 @@
+from typing import Dict, Iterator, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from config.settings import RESULTS_TABLE_COLUMNS
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Read-only table model over per-section frequency results
+
+    Each row is a dict from `calculate_section_frequencies`; a row's cells are
+    formatted the first time any of them is painted or exported, then reused.
+    """
+
+    KEYS = ("section", "tiny", "small", "medium", "large", "fbr", "total")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        self._texts: List[Optional[List[str]]] = []
+
+    def set_rows(self, rows: List[Dict]):
+        """Show a new list of result rows"""
+        same_shape = len(rows) == len(self._rows)
+        if not same_shape:
+            self.beginResetModel()
+        self._rows = rows
+        self._texts = [None] * len(rows)
+        if not same_shape:
+            self.endResetModel()
+        elif rows:
+            # Same row count: repaint in place so the view keeps its scroll position and selection
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, self.columnCount() - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(RESULTS_TABLE_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return RESULTS_TABLE_COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._row_texts(index.row())[index.column()]
+
+    def formatted_rows(self) -> Iterator[List[str]]:
+        """Yield every row as the strings shown in the table"""
+        for i in range(len(self._rows)):
+            yield self._row_texts(i)
+
+    def _row_texts(self, i: int) -> List[str]:
+        texts = self._texts[i]
+        if texts is None:
+            row = self._rows[i]
+            texts = [str(row["section"])]
+            texts += [f"{row[key]:.2e}" for key in self.KEYS[1:]]
+            self._texts[i] = texts
+        return texts
@@ -0,0 +1,81 @@
+from typing import Callable, List
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class SectionsTableModel(QAbstractTableModel):
+    """Table model reading section name, line size and color straight from the sections list
+
+    Cells are produced on demand, so refreshing never allocates per-cell items.
+    Edits are handed to `on_edit(row, column, text)`, which applies them to the
+    section and returns whether they were accepted.
+    """
+
+    HEADERS = ["Section Name", "Line Size [mm]", "Color"]
+
+    def __init__(self, sections_list: List, on_edit: Callable[[int, int, str], bool], parent=None):
+        super().__init__(parent)
+        self._sections = sections_list  # Shared with the main window, which replaces its contents in place
+        self._on_edit = on_edit
+        self._row_count = 0  # Rows the view currently knows about
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self._sections):
+            return None
+        section = self._sections[row]
+        column = index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == 0:
+                return section.name
+            if column == 1:
+                return f"{section.line_size:.2f}" if section.line_size is not None else ""
+            return section.color.name() if section.color else "Auto"
+        if role == Qt.ItemDataRole.BackgroundRole and column == 2:
+            return section.color
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDragEnabled
+        elif index.column() == 1:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        if not self._on_edit(index.row(), index.column(), str(value).strip()):
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def refresh(self):
+        """Sync the row count with the sections list and repaint every row"""
+        new_count = len(self._sections)
+        if new_count > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, new_count - 1)
+            self._row_count = new_count
+            self.endInsertRows()
+        elif new_count < self._row_count:
+            self.beginRemoveRows(QModelIndex(), new_count, self._row_count - 1)
+            self._row_count = new_count
+            self.endRemoveRows()
+        if new_count:
+            self.refresh_rows(0, new_count - 1)
+
+    def refresh_rows(self, first: int, last: int):
+        """Repaint rows first..last after their sections changed"""
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.HEADERS) - 1))
@@ -1,10 +1,30 @@
 """
 UI Panel components for the main window.
+
+Panels are imported on first access, so importing one panel module does
+not load the others.
 """
 
-from .viewer_panel import ViewerPanel
-from .sections_panel import SectionsPanel
-from .objects_panel import ObjectsPanel
-from .results_panel import ResultsPanel
+import importlib
+
+_PANEL_MODULES = {
+    'ViewerPanel': 'viewer_panel',
+    'SectionsPanel': 'sections_panel',
+    'ObjectsPanel': 'objects_panel',
+    'ResultsPanel': 'results_panel',
+}
+
+__all__ = ['ViewerPanel', 'SectionsPanel', 'ObjectsPanel', 'ResultsPanel']
+
+
+def __getattr__(name):
+    module_name = _PANEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    panel = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = panel
+    return panel
+
 
-__all__ = ['ViewerPanel', 'SectionsPanel', 'ObjectsPanel', 'ResultsPanel'] 
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
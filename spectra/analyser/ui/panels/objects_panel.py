@@ -1,15 +1,20 @@
+from typing import List, Optional
+
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QProgressBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from detection.categories_map import get_all_frequency_categories
+from ui.models import DetectionsTableModel
+from ui.widgets import resize_columns_later, sync_combo_items
 
 
 class ObjectsPanel:
@@ -20,6 +25,8 @@ class ObjectsPanel:
         self.section_filter_dropdown = None
         self.category_filter_dropdown = None
         self.objects_table = None
+        self.objects_model = None
+        self._last_state = None
         self.progress_bar = None
         
     def create_panel(self):
@@ -45,9 +52,7 @@ class ObjectsPanel:
         filter_layout.addWidget(category_filter_label)
         
         self.category_filter_dropdown = QComboBox()
-        self.category_filter_dropdown.addItem("All")
-        for cat in get_all_frequency_categories():
-            self.category_filter_dropdown.addItem(cat)
+        self.category_filter_dropdown.addItems(["All", *get_all_frequency_categories()])
         self.category_filter_dropdown.currentIndexChanged.connect(
             self.main_window.apply_section_filter
         )
@@ -56,20 +61,13 @@ class ObjectsPanel:
         objects_layout.addLayout(filter_layout)
 
         # Objects table
-        self.objects_table = QTableWidget()
-        self.objects_table.setColumnCount(8)
-        self.objects_table.setHorizontalHeaderLabels(
-            [
-                "Object",
-                "Page",
-                "Section",
-                "X1,Y1",
-                "X2,Y2",
-                "Line Size [mm]",
-                "Count",
-                "Confidence",
-            ]
-        )
+        self.objects_table = QTableView()
+        self.objects_model = DetectionsTableModel(self.main_window.sections_list, self.objects_table)
+        self.objects_table.setModel(self.objects_model)
+        # The view only materializes visible rows; keep row heights fixed and size
+        # columns from the visible rows so neither walks the whole model
+        self.objects_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.objects_table.horizontalHeader().setResizeContentsPrecision(0)
         objects_layout.addWidget(self.objects_table)
 
         self.progress_bar = QProgressBar()
@@ -83,63 +81,48 @@ class ObjectsPanel:
         if not self.objects_table:
             return
             
-        filtered = self.main_window.get_filtered_detections()
-        self.objects_table.setRowCount(len(filtered))
-        
-        for i, detection in enumerate(filtered):
-            self.objects_table.setItem(i, 0, QTableWidgetItem(detection.name))
-            self.objects_table.setItem(i, 1, QTableWidgetItem(str(detection.page_num)))
-            
-            section_str = getattr(detection, "section", "Unassigned")
-            self.objects_table.setItem(i, 2, QTableWidgetItem(section_str))
-            
-            bbox = detection.bbox
-            coord1 = f"{bbox[0]},{bbox[1]}"
-            coord2 = f"{bbox[2]},{bbox[3]}"
-            self.objects_table.setItem(i, 3, QTableWidgetItem(coord1))
-            self.objects_table.setItem(i, 4, QTableWidgetItem(coord2))
-            
-            # Line size (show override if present, else section's)
-            line_size = (
-                detection.line_size
-                if getattr(detection, "line_size", None) is not None
-                else None
-            )
-            if line_size is None:
-                # Try to get from section
-                for section in self.main_window.sections_list:
-                    if section.name == section_str:
-                        line_size = section.line_size
-                        break
-            line_size_str = f"{line_size:.2f}" if line_size is not None else ""
-            self.objects_table.setItem(i, 5, QTableWidgetItem(line_size_str))
-            
-            # Count
-            count_str = str(getattr(detection, "count", 1))
-            self.objects_table.setItem(i, 6, QTableWidgetItem(count_str))
-            
-            # Confidence
-            conf_str = f"{detection.confidence:.3f}"
-            self.objects_table.setItem(i, 7, QTableWidgetItem(conf_str))
-            
-        self.objects_table.resizeColumnsToContents()
+        # Nothing to redo if the filters and the data are as last shown
+        state = (
+            self.section_filter_dropdown.currentText(),
+            self.category_filter_dropdown.currentText(),
+            id(self.main_window.detections),
+            len(self.main_window.detections),
+            self.main_window.data_version,
+            # Checked directly too, since names, order and line sizes drive the output
+            tuple((section.name, section.line_size) for section in self.main_window.sections_list),
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        self.objects_model.set_rows(self.main_window.get_filtered_detections())
+        resize_columns_later(self.objects_table)
+
+    def refresh_detection(self, detection):
+        """Repaint one detection that changed in place, or rebuild if it moved in or out of the filters"""
+        if not self.objects_table:
+            return
+        section_filter = self.section_filter_dropdown.currentText()
+        category_filter = self.category_filter_dropdown.currentText()
+        still_shown = (
+            section_filter in ("All", getattr(detection, "section", "Unassigned"))
+            and category_filter in ("All", detection.name)
+        )
+        if not (still_shown and self.objects_model.update_detection(detection)):
+            self.main_window.update_objects_table()
 
-    def update_section_filter_dropdown(self):
+    def update_section_filter_dropdown(self, section_names: Optional[List[str]] = None):
         """Update the section filter dropdown with current sections"""
         if not self.section_filter_dropdown:
             return
+        if section_names is None:
+            section_names = [section.name for section in self.main_window.sections_list]
             
-        current = self.section_filter_dropdown.currentText()
-        self.section_filter_dropdown.blockSignals(True)
-        self.section_filter_dropdown.clear()
-        self.section_filter_dropdown.addItem("All")
-        
-        # Add section names, not Section objects
-        section_names = [section.name for section in self.main_window.sections_list]
-        for section_name in section_names:
-            self.section_filter_dropdown.addItem(section_name)
-            
-        self.section_filter_dropdown.setCurrentText(
-            current if current in ["All"] + section_names else "All"
-        )
-        self.section_filter_dropdown.blockSignals(False) 
\ No newline at end of file
+        combo = self.section_filter_dropdown
+        current = combo.currentText()
+        with QSignalBlocker(combo):
+            sync_combo_items(combo, ["All"] + section_names)
+            combo.setCurrentIndex(combo.findText(current) if current in section_names else 0)
+        # Signals were held back, so apply a filter that fell back to "All" in one refresh
+        if combo.currentText() != current:
+            self.main_window.apply_section_filter()
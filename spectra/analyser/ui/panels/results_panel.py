@@ -1,17 +1,85 @@
+from collections import namedtuple
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QSignalBlocker, Qt, QThreadPool, Signal, Slot
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
+    QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from ui.models import ResultsTableModel
+from ui.widgets import resize_columns_later, sync_combo_items
 from utils.frequency import calculate_section_frequencies
 
 
+# Immutable copies of the fields calculate_section_frequencies reads, taken on
+# the main thread so workers never touch live Section/Detection objects
+_SectionSnapshot = namedtuple("_SectionSnapshot", "name line_size")
+_DetectionSnapshot = namedtuple("_DetectionSnapshot", "name section line_size count")
+
+
+def _calculate_results(sections, detections, frequency_table, section_filter: str) -> list:
+    """Compute the frequency rows shown for the given section filter"""
+    results = calculate_section_frequencies(sections, detections, frequency_table)
+    # Filter results by section if needed
+    if section_filter != "All":
+        results = [row for row in results if str(row["section"]) == section_filter]
+    return results
+
+
+class _FrequencySignals(QObject):
+    """Signals for a frequency worker; QRunnable itself can't emit"""
+    finished = Signal(int, list)  # generation, results
+    error_occurred = Signal(int, str)  # generation, message
+
+
+class _FrequencyReceiver(QObject):
+    """Main-thread receiver that hands worker results to the panel"""
+
+    def __init__(self, panel):
+        super().__init__()
+        self.panel = panel
+
+    @Slot(int, list)
+    def on_finished(self, generation: int, results: list):
+        self.panel.on_frequencies_ready(generation, results)
+
+    @Slot(int, str)
+    def on_error(self, generation: int, error_message: str):
+        self.panel.on_frequencies_error(generation, error_message)
+
+
+class _FrequencyWorker(QRunnable):
+    """Compute section frequencies on the thread pool
+
+    Works on tuple snapshots of the sections and detections and only emits
+    signals; the panel applies the results on the main thread.
+    """
+
+    def __init__(self, generation: int, sections, detections, frequency_table, section_filter: str):
+        super().__init__()
+        self.signals = _FrequencySignals()
+        self.generation = generation
+        self.sections = sections
+        self.detections = detections
+        self.frequency_table = frequency_table
+        self.section_filter = section_filter
+
+    def run(self):
+        try:
+            results = _calculate_results(self.sections, self.detections, self.frequency_table, self.section_filter)
+            self.signals.finished.emit(self.generation, results)
+        except Exception as e:
+            self.signals.error_occurred.emit(self.generation, str(e))
+
+
 class ResultsPanel:
     """Manages the results panel for frequency calculations"""
     
@@ -19,6 +87,11 @@ class ResultsPanel:
         self.main_window = main_window
         self.results_section_filter_dropdown = None
         self.results_table = None
+        self.results_model = None
+        self._last_state = None
+        self._generation = 0  # Bumped per submitted calculation; older results are discarded
+        self._shown_generation = 0  # Generation of the results in the table
+        self._receiver = _FrequencyReceiver(self)
         self.export_results_button = None
         
     def create_panel(self):
@@ -39,10 +112,13 @@ class ResultsPanel:
         )
         results_filter_layout.addWidget(self.results_section_filter_dropdown)
         
-        self.results_table = QTableWidget()
-        from config.settings import RESULTS_TABLE_COLUMNS
-        self.results_table.setColumnCount(len(RESULTS_TABLE_COLUMNS))
-        self.results_table.setHorizontalHeaderLabels(RESULTS_TABLE_COLUMNS)
+        self.results_table = QTableView()
+        self.results_model = ResultsTableModel(self.results_table)
+        self.results_table.setModel(self.results_model)
+        # The view only materializes visible rows; keep row heights fixed and size
+        # columns from the visible rows so neither walks the whole model
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.results_table.horizontalHeader().setResizeContentsPrecision(0)
         
         results_layout.addLayout(results_filter_layout)
         results_layout.addWidget(self.results_table)
@@ -53,8 +129,12 @@ class ResultsPanel:
 
         return results_widget
 
-    def update_results_table(self):
-        """Update the Results tab with frequency calculations for all sections."""
+    def update_results_table(self, wait: bool = False):
+        """Update the Results tab with frequency calculations for all sections.
+
+        The calculation normally runs on the thread pool. With wait=True it runs
+        synchronously when the table is not current, e.g. before an export.
+        """
         if not self.results_table:
             return
             
@@ -64,44 +144,76 @@ class ResultsPanel:
             else "All"
         )
         
-        results = calculate_section_frequencies(
-            self.main_window.sections_list, 
-            self.main_window.detections, 
-            self.main_window.frequency_table
+        # Nothing to redo if the filter and the data are as last shown
+        state = (
+            section_filter,
+            id(self.main_window.detections),
+            len(self.main_window.detections),
+            self.main_window.data_version,
+            # Checked directly too, since names, order and line sizes drive the output
+            tuple((section.name, section.line_size) for section in self.main_window.sections_list),
         )
-        
-        # Filter results by section if needed
-        if section_filter != "All":
-            results = [row for row in results if str(row["section"]) == section_filter]
-            
-        self.results_table.setRowCount(len(results))
-        
-        for i, row in enumerate(results):
-            self.results_table.setItem(i, 0, QTableWidgetItem(str(row["section"])))
-            self.results_table.setItem(i, 1, QTableWidgetItem(f"{row['tiny']:.2e}"))
-            self.results_table.setItem(i, 2, QTableWidgetItem(f"{row['small']:.2e}"))
-            self.results_table.setItem(i, 3, QTableWidgetItem(f"{row['medium']:.2e}"))
-            self.results_table.setItem(i, 4, QTableWidgetItem(f"{row['large']:.2e}"))
-            self.results_table.setItem(i, 5, QTableWidgetItem(f"{row['fbr']:.2e}"))
-            self.results_table.setItem(i, 6, QTableWidgetItem(f"{row['total']:.2e}"))
-            
-        self.results_table.resizeColumnsToContents()
+        pending = self._shown_generation != self._generation
+        if state == self._last_state and not (wait and pending):
+            return
+        self._last_state = state
+
+        # Only the latest submission gets applied
+        self._generation += 1
+        sections = [_SectionSnapshot(s.name, s.line_size) for s in self.main_window.sections_list]
+        detections = [
+            _DetectionSnapshot(d.name, d.section, d.line_size, d.count) for d in self.main_window.detections
+        ]
+        if wait:
+            try:
+                results = _calculate_results(sections, detections, self.main_window.frequency_table, section_filter)
+            except Exception as e:
+                self.on_frequencies_error(self._generation, str(e))
+            else:
+                self.on_frequencies_ready(self._generation, results)
+            return
+
+        worker = _FrequencyWorker(
+            self._generation, sections, detections, self.main_window.frequency_table, section_filter
+        )
+        worker.signals.finished.connect(self._receiver.on_finished, Qt.ConnectionType.QueuedConnection)
+        worker.signals.error_occurred.connect(self._receiver.on_error, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+
+    def is_current(self) -> bool:
+        """Whether the table shows the results of the latest calculation"""
+        return self._last_state is not None and self._shown_generation == self._generation
 
-    def update_results_section_filter_dropdown(self):
+    def on_frequencies_ready(self, generation: int, results: list):
+        """Show finished frequency results unless a newer calculation is pending"""
+        if generation != self._generation:
+            return
+        self._shown_generation = generation
+        self.results_model.set_rows(results)
+        resize_columns_later(self.results_table)
+
+    def on_frequencies_error(self, generation: int, error_message: str):
+        """Report a failed frequency calculation unless a newer one is pending"""
+        if generation != self._generation:
+            return
+        # Let the next refresh retry even if nothing changed
+        self._last_state = None
+        QMessageBox.warning(
+            self.main_window, "Results Error", f"Error calculating frequencies:\n{error_message}"
+        )
+
+    def update_results_section_filter_dropdown(self, section_names: Optional[List[str]] = None):
         """Update the results section filter dropdown"""
         if not self.results_section_filter_dropdown:
             return
+        if section_names is None:
+            section_names = [section.name for section in self.main_window.sections_list]
             
-        current = self.results_section_filter_dropdown.currentText()
-        self.results_section_filter_dropdown.blockSignals(True)
-        self.results_section_filter_dropdown.clear()
-        self.results_section_filter_dropdown.addItem("All")
-        
-        section_names = [section.name for section in self.main_window.sections_list]
-        for section_name in section_names:
-            self.results_section_filter_dropdown.addItem(section_name)
-            
-        self.results_section_filter_dropdown.setCurrentText(
-            current if current in ["All"] + section_names else "All"
-        )
-        self.results_section_filter_dropdown.blockSignals(False) 
\ No newline at end of file
+        combo = self.results_section_filter_dropdown
+        current = combo.currentText()
+        with QSignalBlocker(combo):
+            sync_combo_items(combo, ["All"] + section_names)
+            combo.setCurrentIndex(combo.findText(current) if current in section_names else 0)
+        # Signals were held back, so apply a filter that fell back to "All" in one refresh
+        if combo.currentText() != current:
+            self.main_window.update_results_table()
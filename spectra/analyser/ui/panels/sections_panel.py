@@ -3,9 +3,8 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QPushButton,
-    QTableWidget,
+    QTableView,
     QVBoxLayout,
-    QWidget,
 )
 
 from sections.sections import (
@@ -15,6 +14,8 @@ from sections.sections import (
     move_section_up,
     update_sections_table,
 )
+from ui.models import SectionsTableModel
+from ui.widgets import PanelWidget
 
 
 class SectionsPanel:
@@ -23,19 +24,26 @@ class SectionsPanel:
     def __init__(self, main_window):
         self.main_window = main_window
         self.sections_table = None
+        self.sections_model = None
+        self.panel_widget = None
+        self._table_dirty = False  # A refresh was skipped while the panel was hidden
         
     def create_panel(self):
         """Create the sections panel with table and controls"""
-        sections_panel = QWidget()
+        sections_panel = PanelWidget()
+        sections_panel.shown.connect(self._on_panel_shown)
+        self.panel_widget = sections_panel
         sections_layout = QVBoxLayout()
         sections_panel.setLayout(sections_layout)
 
         # Create sections table
-        self.sections_table = QTableWidget()
-        self.sections_table.setColumnCount(3)
-        self.sections_table.setHorizontalHeaderLabels(
-            ["Section Name", "Line Size [mm]", "Color"]
+        self.sections_table = QTableView()
+        self.sections_model = SectionsTableModel(
+            self.main_window.sections_list,
+            lambda row, column, text: handle_section_edit(self.main_window, row, column, text),
+            self.sections_table,
         )
+        self.sections_table.setModel(self.sections_model)
         self.sections_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.sections_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.sections_table.setEditTriggers(
@@ -52,10 +60,6 @@ class SectionsPanel:
         if vheader is not None:
             vheader.setVisible(False)
 
-        self.sections_table.itemChanged.connect(
-            lambda item: handle_section_edit(self.main_window, item)
-        )
-
         sections_layout.addWidget(self.sections_table, 1)
 
         # Buttons to move sections up/down
@@ -73,4 +77,17 @@ class SectionsPanel:
         # Initial update
         update_sections_table(self.main_window)
 
-        return sections_panel 
\ No newline at end of file
+        return sections_panel
+
+    def refresh_table(self):
+        """Refresh the sections table now if it is on screen, otherwise when it is next shown"""
+        if self.panel_widget is not None and not self.panel_widget.isVisible():
+            self._table_dirty = True
+            return
+        self._table_dirty = False
+        update_sections_table(self.main_window)
+
+    def _on_panel_shown(self):
+        """Apply a refresh that was deferred while the panel was hidden"""
+        if self._table_dirty:
+            self.refresh_table() 
\ No newline at end of file
@@ -29,6 +29,7 @@ class ViewerPanel:
         self.reset_zoom_button = None
         self.fit_to_window_button = None
         self.zoom_label = None
+        self._nav_state = None  # (has_pdf, current_page, total_pages) last applied
         
     def create_panel(self):
         """Create the viewer panel with PDF viewer and navigation controls"""
@@ -121,6 +122,18 @@ class ViewerPanel:
         current_page = self.pdf_viewer.current_page if self.pdf_viewer else 0
         total_pages = self.pdf_viewer.total_pages if self.pdf_viewer else 0
 
+        # Always resync the page input, it may hold text the user typed
+        if self.page_input:
+            page_text = f"{current_page + 1}/{total_pages}" if has_pdf else "0/0"
+            if self.page_input.text() != page_text:
+                self.page_input.setText(page_text)
+
+        # Button states only depend on the navigation state
+        nav_state = (has_pdf, current_page, total_pages)
+        if nav_state == self._nav_state:
+            return
+        self._nav_state = nav_state
+
         # Reset UI states
         if self.prev_page_button:
             self.prev_page_button.setEnabled(has_pdf and current_page > 0)
@@ -134,11 +147,6 @@ class ViewerPanel:
             self.reset_zoom_button.setEnabled(has_pdf)
         if self.fit_to_window_button:
             self.fit_to_window_button.setEnabled(has_pdf)
-        if self.page_input:
-            if has_pdf:
-                self.page_input.setText(f"{current_page + 1}/{total_pages}")
-            else:
-                self.page_input.setText("0/0")
 
     def update_zoom_label(self, zoom_factor: float):
         """Update the zoom label with current zoom percentage"""
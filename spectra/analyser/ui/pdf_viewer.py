@@ -1,8 +1,8 @@
-import copy as _copy
 import io
 import os
 import shutil
 import tempfile
+from collections import OrderedDict
 from typing import List, Optional, Tuple, cast
 
 from PIL import Image
@@ -20,6 +20,22 @@ from PySide6.QtGui import (
 from PySide6.QtWidgets import QLabel, QMenu, QMessageBox
 import fitz
 
+from config.settings import PAGE_CACHE_SIZE, PAGE_PREFETCH_COUNT
+from sections.geometry import point_in_polygon
+
+
+def render_page_image(page, image_path: str):
+    """Render a PDF page to a PNG file"""
+    # Render at high DPI for quality
+    mat = fitz.Matrix(2.0, 2.0)  # 2x scaling for better quality
+    pix = page.get_pixmap(matrix=mat)  # type: ignore[attr-defined]
+
+    # Convert to PIL Image and save
+    img_data = pix.tobytes("ppm")
+    pil_image = Image.open(io.BytesIO(img_data))
+    pil_image.save(image_path, format="PNG")
+
+
 class PDFViewer(QLabel):
     """PDF Viewer with zoom and pan"""
     # UI Signals
@@ -38,58 +54,83 @@ class PDFViewer(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setText("No PDF loaded")
 
+        self.temp_dir = None
+
+        # Idle-time page pre-rendering, one page per timer tick
+        self._prefetch_queue = []
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.timeout.connect(self._prefetch_next_page)
+
+        # Display properties
+        self.min_zoom = 0.1
+        self.max_zoom = 10.0
+        self.zoom_step = 0.2
+        self.handle_size = 8
+
+        # Per-document state (PDF, caches, detections, sections, interaction)
+        self._reset_document_state()
+
+        self.debug_mode = True  # Set to True to show detection areas
+
+        # Display update batching
+        self._display_update_pending = False
+        self._display_update_timer = QTimer()
+        self._display_update_timer.setSingleShot(True)
+        self._display_update_timer.timeout.connect(self._perform_display_update)
+        
+        # Enable mouse tracking for pan
+        self.setMouseTracking(True)
+
+    def _reset_document_state(self):
+        """Reset all per-document state to its initial values"""
         # PDF handling
         self.pdf_document = None
         self.current_page = 0
         self.total_pages = 0
-        self.temp_dir = None
-        
+
         # Page caching to prevent unnecessary re-rendering
-        self._page_cache = {}  # page_num -> (pixmap, temp_path)
-        self._page_cache_rendered = set()  # Set of page numbers that have been rendered
-        
+        self._page_cache = OrderedDict()  # page_num -> (pixmap, temp_path), least recently used first
+        self._page_paths = {}  # page_num -> rendered image path
+
         # Display properties
         self.zoom_factor = 1.0
-        self.min_zoom = 0.1
-        self.max_zoom = 10.0
-        self.zoom_step = 0.2
         self.image_offset = [0, 0]
-        
+
         # Pixmaps
         self.original_pixmap = None
         self.scaled_pixmap = None
-        
+
         # Detection data
         self.detections = []
-        
-        # Section data
+
+        # Section data (shared with the main window, so rebind rather than clear)
         self.sections = []
         self.section_points = []
-        
+
         # Pan properties
         self.pan_start_pos = None
         self.is_panning = False
-        
+
         # Drawing modes
         self.add_object_mode = False
         self.drawing_box = False
         self.box_start = None
         self.box_end = None
-        
+
         # Section drawing mode
         self.add_section_mode = False
         self.drawing_section = False
-        
+
         # Drag/resize bbox state
         self.selected_bbox_index = None
         self.dragging = False
         self.resizing = False
         self.resize_handle = None
         self.drag_offset = None
+        self.drag_start_bbox = None
         self.resize_start_bbox = None
         self.resize_start_pos = None
-        self.handle_size = 8
-        
+
         # Polyline selection state
         self.selected_section_index = None
         self.selected_polyline_index = None
@@ -98,16 +139,6 @@ class PDFViewer(QLabel):
         self._polyline_drag_start_pos = None
         self._polyline_drag_start_points = None
         self._polyline_point_drag_idx = None
-        self.debug_mode = True  # Set to True to show detection areas
-
-        # Display update batching
-        self._display_update_pending = False
-        self._display_update_timer = QTimer()
-        self._display_update_timer.setSingleShot(True)
-        self._display_update_timer.timeout.connect(self._perform_display_update)
-        
-        # Enable mouse tracking for pan
-        self.setMouseTracking(True)
 
     def __del__(self):
         """Destructor to ensure cleanup is called when object is destroyed"""
@@ -121,12 +152,13 @@ class PDFViewer(QLabel):
         """Load PDF and convert pages to images"""
         try:
             # Clean up previous temp directory and cache
+            self._cancel_prefetch()
             if self.temp_dir and os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir)
             
             # Clear page cache
             self._page_cache.clear()
-            self._page_cache_rendered.clear()
+            self._page_paths.clear()
 
             # Create new temp directory
             self.temp_dir = tempfile.mkdtemp()
@@ -152,6 +184,7 @@ class PDFViewer(QLabel):
             
         # Check if page is already cached
         if self.current_page in self._page_cache:
+            self._page_cache.move_to_end(self.current_page)
             pixmap, temp_path = self._page_cache[self.current_page]
             self.original_pixmap = pixmap
             self.update_display()
@@ -170,26 +203,17 @@ class PDFViewer(QLabel):
             return None
             
         try:
-            # Get page
-            page = self.pdf_document[page_num]
-            
-            # Render at high DPI for quality
-            mat = fitz.Matrix(2.0, 2.0)  # 2x scaling for better quality
-            pix = page.get_pixmap(matrix=mat)  # type: ignore[attr-defined]
-            
-            # Convert to PIL Image then to QPixmap
-            img_data = pix.tobytes("ppm")
-            pil_image = Image.open(io.BytesIO(img_data))
-            
-            # Convert PIL to QPixmap
-            temp_path = os.path.join(self.temp_dir, f"page_{page_num}.png")
-            pil_image.save(temp_path)
+            # Reuse the image if the page was already rendered (e.g. pre-rendered)
+            temp_path = self._page_paths.get(page_num)
+            if temp_path is None or not os.path.exists(temp_path):
+                temp_path = os.path.join(self.temp_dir, f"page_{page_num}.png")
+                render_page_image(self.pdf_document[page_num], temp_path)
+                self._page_paths[page_num] = temp_path
             
             pixmap = QPixmap(temp_path)
             
             # Cache the rendered page
-            self._page_cache[page_num] = (pixmap, temp_path)
-            self._page_cache_rendered.add(page_num)
+            self._cache_page(page_num, pixmap, temp_path)
             
             return pixmap, temp_path
             
@@ -197,6 +221,53 @@ class PDFViewer(QLabel):
             QMessageBox.critical(None, "Error Rendering Page", f"Error rendering page {page_num}: {e}")
             return None
         
+    def _cache_page(self, page_num: int, pixmap: QPixmap, temp_path: str):
+        """Add a page pixmap to the cache, evicting the least recently used page if full"""
+        self._page_cache[page_num] = (pixmap, temp_path)
+        self._page_cache.move_to_end(page_num)
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+    def prefetch_pages(self, count: int = PAGE_PREFETCH_COUNT):
+        """Pre-render the first pages of the loaded PDF while the UI is idle
+
+        Pages are rendered from the viewer's own document on the main thread,
+        as PyMuPDF documents are not thread-safe. Each timer tick renders one
+        page, so input and repaints are handled between pages.
+        """
+        self._cancel_prefetch()
+        if not self.pdf_document or self.temp_dir is None:
+            return
+        self._prefetch_queue = [p for p in range(min(self.total_pages, count)) if p not in self._page_paths]
+        if self._prefetch_queue:
+            self._prefetch_timer.start(0)
+
+    def _cancel_prefetch(self):
+        """Stop pre-rendering; any pages not yet rendered are dropped"""
+        self._prefetch_queue = []
+        self._prefetch_timer.stop()
+
+    def _prefetch_next_page(self):
+        """Render the next queued page, loading it while the cache has free slots"""
+        if not self._prefetch_queue or not self.pdf_document or self.temp_dir is None:
+            self._cancel_prefetch()
+            return
+        page_num = self._prefetch_queue.pop(0)
+        if not self._prefetch_queue:
+            self._prefetch_timer.stop()
+        if page_num in self._page_paths:
+            return
+        temp_path = os.path.join(self.temp_dir, f"page_{page_num}.png")
+        try:
+            render_page_image(self.pdf_document[page_num], temp_path)
+        except Exception:
+            # The page is rendered on demand instead
+            return
+        self._page_paths[page_num] = temp_path
+        if page_num not in self._page_cache and len(self._page_cache) < PAGE_CACHE_SIZE:
+            self._page_cache[page_num] = (QPixmap(temp_path), temp_path)
+            self._page_cache.move_to_end(page_num, last=False)
+
     def set_page(self, page_num: int):
         """Set current page (0-indexed)"""
         if 0 <= page_num < self.total_pages:
@@ -473,7 +544,7 @@ class PDFViewer(QLabel):
             
             for s_idx, section in enumerate(self.sections):
                 for p_idx, polyline in enumerate(getattr(section, 'polylines', [])):
-                    if polyline.page != self.current_page + 1:
+                    if not polyline.on_page(self.current_page + 1):
                         continue
                     if not polyline.points or len(polyline.points) < 2:
                         continue
@@ -497,7 +568,7 @@ class PDFViewer(QLabel):
             if nearest_seg is None or nearest_seg[0] != 'point':
                 for s_idx, section in enumerate(self.sections):
                     for p_idx, polyline in enumerate(getattr(section, 'polylines', [])):
-                        if polyline.page != self.current_page + 1:
+                        if not polyline.on_page(self.current_page + 1):
                             continue
                         if not polyline.points or len(polyline.points) < 2:
                             continue
@@ -758,7 +829,7 @@ class PDFViewer(QLabel):
                 idx = self._polyline_point_drag_idx
                 # Convert widget pos to image coords
                 img_x, img_y = self.widget_to_image_coords(event.pos().x(), event.pos().y())
-                polyline.points[idx] = (img_x, img_y)
+                polyline.move_point(idx, (img_x, img_y))
                 self.setCursor(Qt.CursorShape.SizeAllCursor)  # Show move cursor during point drag
                 self.update()
                 return
@@ -772,7 +843,7 @@ class PDFViewer(QLabel):
                 section = self.sections[s_idx]
                 polyline = section.polylines[p_idx]
                 
-                if polyline.page == self.current_page + 1 and self.scaled_pixmap:
+                if polyline.on_page(self.current_page + 1) and self.scaled_pixmap:
                     widget_points = self.convert_polyline_points_to_widget(polyline.points)
                     
                     # Check if hovering over any point with larger hit area
@@ -878,8 +949,9 @@ class PDFViewer(QLabel):
                 idx = self._polyline_point_drag_idx
                 # Convert widget pos to image coords
                 img_x, img_y = self.widget_to_image_coords(event.pos().x(), event.pos().y())
-                polyline.points[idx] = (img_x, img_y)
+                polyline.move_point(idx, (img_x, img_y))
                 self._polyline_point_drag_idx = None
+                self._sections_changed()
                 self.update()
                 return
         
@@ -889,6 +961,7 @@ class PDFViewer(QLabel):
                 self._polyline_dragging = False
                 self._polyline_drag_start_pos = None
                 self._polyline_drag_start_points = None
+                self._sections_changed()
                 self.update()
                 return
         
@@ -907,10 +980,9 @@ class PDFViewer(QLabel):
         image_paths = []
         for page_num in range(self.total_pages):
             try:
-                # Check if page is already cached
-                if page_num in self._page_cache:
-                    _, temp_path = self._page_cache[page_num]
-                    image_paths.append(temp_path)
+                # Check if page is already rendered
+                if page_num in self._page_paths and os.path.exists(self._page_paths[page_num]):
+                    image_paths.append(self._page_paths[page_num])
                     continue
                 
                 # Render page if not cached
@@ -924,6 +996,9 @@ class PDFViewer(QLabel):
     
     def cleanup(self):
         """Clean up temporary files and reset all state variables to prevent memory leaks"""
+        # Stop background rendering before removing its output directory
+        self._cancel_prefetch()
+
         # Close and clear PDF document
         if self.pdf_document:
             self.pdf_document.close()
@@ -934,63 +1009,11 @@ class PDFViewer(QLabel):
             shutil.rmtree(self.temp_dir)
             self.temp_dir = None
 
-        # Clear page cache
-        self._page_cache.clear()
-        self._page_cache_rendered.clear()
-
-        # Reset PDF handling state
-        self.current_page = 0
-        self.total_pages = 0
-
-        # Reset display properties
-        self.zoom_factor = 1.0
-        self.image_offset = [0, 0]
-
-        # Clear pixmaps to free memory
-        if self.original_pixmap:
-            self.original_pixmap = None
-        if self.scaled_pixmap:
-            self.scaled_pixmap = None
-
-        # Clear all data structures that might hold references
-        self.detections.clear()
-        self.sections.clear()
-        self.section_points.clear()
-
-        # Reset pan properties
-        self.pan_start_pos = None
-        self.is_panning = False
-
-        # Reset drawing modes
-        self.add_object_mode = False
-        self.drawing_box = False
-        self.box_start = None
-        self.box_end = None
-
-        # Reset section drawing mode
-        self.add_section_mode = False
-        self.drawing_section = False
-
-        # Reset drag/resize bbox state
-        self.selected_bbox_index = None
-        self.dragging = False
-        self.resizing = False
-        self.resize_handle = None
-        self.drag_offset = None
-        self.resize_start_bbox = None
-        self.resize_start_pos = None
-
-        # Reset polyline selection state
-        self.selected_section_index = None
-        self.selected_polyline_index = None
-        self._polyline_clipboard = None
-        self._polyline_dragging = False
-        self._polyline_drag_start_pos = None
-        self._polyline_drag_start_points = None
-        self._polyline_point_drag_idx = None
+        self._reset_document_state()
 
         # Reset cursor and display
         self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._set_opaque_painting(False)
         self.setText("No PDF loaded")
         self.update()
 
@@ -1039,7 +1062,7 @@ class PDFViewer(QLabel):
         section = self.sections[s_idx]
         polyline = section.polylines[p_idx]
         
-        if polyline.page != self.current_page + 1:
+        if not polyline.on_page(self.current_page + 1):
             return None
             
         # Convert polyline points to widget coordinates
@@ -1117,36 +1140,22 @@ class PDFViewer(QLabel):
         # Convert widget coordinates to image coordinates
         img_x, img_y = self.widget_to_image_coords(pos.x(), pos.y())
         
+        page = self.current_page + 1
         for i, section in enumerate(self.sections):
             for polyline in getattr(section, 'polylines', []):
-                if polyline.page != self.current_page + 1:
+                if not polyline.on_page(page):
                     continue
-                if not polyline.points or len(polyline.points) < 2:
+                if not polyline.points or len(polyline.points) < 3:
+                    continue
+                # Only ray cast polylines whose bounding box holds the point
+                min_x, min_y, max_x, max_y = polyline.bbox
+                if img_x < min_x or img_x > max_x or img_y < min_y or img_y > max_y:
                     continue
-                # Simple point-in-polygon test using ray casting
-                if self._point_in_polygon(img_x, img_y, polyline.points):
+                if point_in_polygon((img_x, img_y), polyline.points):
                     return i
         
         return None
 
-    def _point_in_polygon(self, x: float, y: float, points: List[Tuple[float, float]]) -> bool:
-        """Ray casting algorithm to test if point is inside polygon"""
-        if len(points) < 3:
-            return False
-        
-        inside = False
-        j = len(points) - 1
-        
-        for i in range(len(points)):
-            xi, yi = points[i]
-            xj, yj = points[j]
-            
-            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-                inside = not inside
-            j = i
-        
-        return inside
-
     def keyPressEvent(self, event):
         # Polyline clipboard shortcuts
         if (self.selected_section_index is not None and self.selected_polyline_index is not None):
@@ -1244,7 +1253,7 @@ class PDFViewer(QLabel):
             return
         for s_idx, section in enumerate(self.sections):
             for p_idx, polyline in enumerate(getattr(section, 'polylines', [])):
-                if polyline.page != self.current_page + 1:
+                if not polyline.on_page(self.current_page + 1):
                     continue
                 if not polyline.points or len(polyline.points) < 2:
                     continue
@@ -1324,6 +1333,13 @@ class PDFViewer(QLabel):
         for point in widget_points:
             painter.drawEllipse(QPoint(self.safe_int(point.x()), self.safe_int(point.y())), 4, 4)
 
+    def _sections_changed(self):
+        """Tell the main window its sections changed so detections get reassigned"""
+        main_window = self.get_main_window()
+        if main_window is not None:
+            from sections.sections import invalidate_section_assignment_cache
+            invalidate_section_assignment_cache(main_window)
+
     def get_main_window(self):
         # Helper to find the main window for exit_add_object_mode
         parent = self.parent()
@@ -1359,6 +1375,18 @@ class PDFViewer(QLabel):
         
         self.setPixmap(display_pixmap)
         self.resize(source_pixmap.size())
+        # The page pixmap is filled edge to edge, so Qt can skip the background
+        # erase as long as it still covers the whole widget
+        self._set_opaque_painting(
+            display_pixmap.width() >= self.width() and display_pixmap.height() >= self.height()
+        )
+
+    def _set_opaque_painting(self, opaque: bool):
+        """Toggle opaque painting hints while a page pixmap covers the widget"""
+        if self.testAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent) == opaque:
+            return
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, opaque)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, opaque)
 
     def wheelEvent(self, event):
         # Ctrl+Wheel: zoom, Shift+Wheel: pan left/right, else pan up/down
@@ -1451,14 +1479,15 @@ class PDFViewer(QLabel):
             section = self.sections[s_idx]
             polyline = section.polylines[p_idx]
             
-            self._polyline_clipboard = _copy.deepcopy(polyline)
+            self._polyline_clipboard = polyline.clone()
 
     def paste_polyline_to_section(self, section_idx):
         if self._polyline_clipboard is not None and section_idx is not None:
-            polyline = _copy.deepcopy(self._polyline_clipboard)
+            polyline = self._polyline_clipboard.clone()
             # Optionally, set to current page
             polyline.page = self.current_page + 1
             self.sections[section_idx].polylines.append(polyline)
+            self._sections_changed()
             self.selected_polyline_index = len(self.sections[section_idx].polylines) - 1
             self.selected_section_index = section_idx
             self.update()
@@ -1470,6 +1499,7 @@ class PDFViewer(QLabel):
             section = self.sections[s_idx]
             if 0 <= p_idx < len(section.polylines):
                 del section.polylines[p_idx]
+                self._sections_changed()
                 # Adjust selection
                 if p_idx >= len(section.polylines):
                     self.selected_polyline_index = len(section.polylines) - 1 if section.polylines else None
@@ -1478,7 +1508,7 @@ class PDFViewer(QLabel):
     def paste_polyline_at_pos(self, pos: QPoint):
         """Paste polyline from clipboard at the given widget position, into the first section (or selected section if available)."""
         if self._polyline_clipboard is not None and self.sections:
-            polyline = _copy.deepcopy(self._polyline_clipboard)
+            polyline = self._polyline_clipboard.clone()
             # Place first point at pos, keep shape
             if polyline.points:
                 # Compute offset from first point to pos (in image coords)
@@ -1491,6 +1521,7 @@ class PDFViewer(QLabel):
                 # Paste into selected section if any, else first section
                 section_idx = self.selected_section_index if self.selected_section_index is not None else 0
                 self.sections[section_idx].polylines.append(polyline)
+                self._sections_changed()
                 self.selected_section_index = section_idx
                 self.selected_polyline_index = len(self.sections[section_idx].polylines) - 1
                 self.update()
@@ -1505,7 +1536,8 @@ class PDFViewer(QLabel):
             section = self.sections[s_idx]
             polyline = section.polylines[p_idx]
             if len(polyline.points) > 2:
-                del polyline.points[point_idx]
+                polyline.remove_point(point_idx)
+                self._sections_changed()
                 self.update()
 
     def show_polyline_add_point_context_menu(self, insert_idx, pos_xy, global_pos):
@@ -1519,7 +1551,8 @@ class PDFViewer(QLabel):
             polyline = section.polylines[p_idx]
             # Convert widget coordinates to image coordinates
             img_x, img_y = self.widget_to_image_coords(pos_xy[0], pos_xy[1])
-            polyline.points.insert(insert_idx, (img_x, img_y))
+            polyline.insert_point(insert_idx, (img_x, img_y))
+            self._sections_changed()
             self.update()
 
     def toggle_debug_mode(self):
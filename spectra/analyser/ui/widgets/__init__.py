@@ -1,3 +1,9 @@
 """
 Custom widget components.
-""" 
\ No newline at end of file
+"""
+
+from .combo import sync_combo_items
+from .panel_widget import PanelWidget
+from .table import resize_columns_later
+
+__all__ = ['sync_combo_items', 'PanelWidget', 'resize_columns_later']
@@ -0,0 +1,24 @@
+from typing import List
+
+from PySide6.QtWidgets import QComboBox
+
+
+def sync_combo_items(combo: QComboBox, items: List[str]):
+    """Make the combo box list exactly `items`, replacing only the run that differs"""
+    current = [combo.itemText(i) for i in range(combo.count())]
+    if current == items:
+        return
+
+    # Keep the common leading and trailing items, swap out the middle
+    limit = min(len(current), len(items))
+    prefix = 0
+    while prefix < limit and current[prefix] == items[prefix]:
+        prefix += 1
+    limit -= prefix
+    suffix = 0
+    while suffix < limit and current[-1 - suffix] == items[-1 - suffix]:
+        suffix += 1
+
+    for _ in range(len(current) - prefix - suffix):
+        combo.removeItem(prefix)
+    combo.insertItems(prefix, items[prefix:len(items) - suffix])
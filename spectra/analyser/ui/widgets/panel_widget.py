@@ -0,0 +1,12 @@
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget
+
+
+class PanelWidget(QWidget):
+    """Panel container that announces when it becomes visible, so hidden panels can defer refreshes"""
+
+    shown = Signal()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.shown.emit()
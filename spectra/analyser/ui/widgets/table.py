@@ -0,0 +1,16 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QTableView
+
+
+def resize_columns_later(table: QTableView):
+    """Fit the table's columns to their contents once control returns to the event loop
+
+    Repeated calls before then collapse into a single resize.
+    """
+    timer = getattr(table, '_resize_columns_timer', None)
+    if timer is None:
+        timer = QTimer(table)
+        timer.setSingleShot(True)
+        timer.timeout.connect(table.resizeColumnsToContents)
+        table._resize_columns_timer = timer
+    timer.start(0)
@@ -16,6 +16,7 @@ from .ui_updater import (
     UPDATE_NAVIGATION,
     UPDATE_ZOOM
 )
+from .validation import is_number
 
 __all__ = [
     'FrequencyTable', 
@@ -30,5 +31,6 @@ __all__ = [
     'UPDATE_RESULTS_TABLE',
     'UPDATE_SECTION_FILTER',
     'UPDATE_NAVIGATION',
-    'UPDATE_ZOOM'
+    'UPDATE_ZOOM',
+    'is_number'
 ]
@@ -0,0 +1,18 @@
+"""
+Input validation helpers shared by dialogs.
+"""
+import re
+
+# Plain decimals cover almost every keystroke; anything else falls back to float()
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def is_number(text: str) -> bool:
+    """Return True if `text` parses as a float"""
+    if _NUMBER_RE.fullmatch(text):
+        return True
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True